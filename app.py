@@ -1,6 +1,6 @@
 import os
 import uuid
-from flask import Flask, render_template, request, jsonify, send_file, url_for, session
+from flask import Flask, render_template, request, jsonify, send_file, url_for, session, Response, stream_with_context
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from werkzeug.utils import secure_filename
 from werkzeug.exceptions import RequestEntityTooLarge
@@ -14,6 +14,10 @@ import zipfile
 from datetime import datetime
 import re  # Add regex import for API filename processing
 
+# Filename cleanup patterns for API-generated voiceovers, compiled once
+_FILENAME_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+_FILENAME_UNSAFE_PATTERN = re.compile(r'[^\w\-_]')
+
 # Load environment variables
 load_dotenv()
 
@@ -381,27 +385,15 @@ def download_voiceover(filename):
         if safe_filename != filename:
             return jsonify({'error': 'Invalid filename'}), 400
         
-        file_path = os.path.join(voiceover_system.output_folder, safe_filename)
-        
-        if not os.path.exists(file_path):
+        # One stat (plus cached metadata) resolves both existence and MIME type;
+        # the duration isn't needed to serve the file, so don't probe for it
+        file_info = voiceover_system.get_file_info(safe_filename, include_duration=False)
+        if file_info is None:
             return jsonify({'error': 'File not found'}), 404
         
-        # Determine MIME type based on file extension
-        ext = os.path.splitext(safe_filename)[1].lower()
-        if ext == '.mp3':
-            mimetype = 'audio/mpeg'
-        elif ext == '.wav':
-            mimetype = 'audio/wav'
-        elif ext == '.mp4':
-            mimetype = 'video/mp4'
-        elif ext == '.zip':
-            mimetype = 'application/zip'
-        else:
-            mimetype = 'application/octet-stream'
-        
         return send_file(
-            file_path,
-            mimetype=mimetype,
+            file_info['path'],
+            mimetype=file_info['mimetype'],
             as_attachment=True,
             download_name=safe_filename
         )
@@ -676,6 +668,12 @@ def api_voiceover_download(session_id):
             mimetype = 'audio/mpeg'
         elif format_type == 'wav':
             mimetype = 'audio/wav'
+        elif format_type == 'flac':
+            mimetype = 'audio/flac'
+        elif format_type == 'aac':
+            mimetype = 'audio/aac'
+        elif format_type == 'opus':
+            mimetype = 'audio/ogg'
         else:
             mimetype = 'application/octet-stream'
         
@@ -697,6 +695,35 @@ def api_voiceover_download(session_id):
         traceback.print_exc()
         return jsonify({'error': f'Download failed: {str(e)}'}), 500
 
+@app.route('/api/v1/voiceover/stream', methods=['POST'])
+def api_voiceover_stream():
+    """Stream MP3 voiceover audio to the client while it is being synthesized"""
+    try:
+        data = request.get_json()
+        
+        script = data.get('script', '').strip()
+        if not script:
+            return jsonify({'error': 'Script is required'}), 400
+        
+        voice = data.get('voice', 'onyx')
+        speed = float(data.get('speed', 1.2))
+        
+        if voice not in voiceover_system.available_voices:
+            return jsonify({'error': f'Invalid voice. Use: {", ".join(voiceover_system.available_voices)}'}), 400
+        
+        if not (0.25 <= speed <= 4.0):
+            return jsonify({'error': 'Speed must be between 0.25 and 4.0'}), 400
+        
+        if not voiceover_system.openai_client:
+            return jsonify({'error': 'OpenAI API key not configured'}), 500
+        
+        audio_stream = voiceover_system.generate_speech_stream(script, voice=voice, speed=speed)
+        return Response(stream_with_context(audio_stream), mimetype='audio/mpeg')
+        
+    except Exception as e:
+        print(f"API Voiceover Stream Error: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/debug/<session_id>')
 def debug_session(session_id):
     """Debug endpoint to check session status"""
@@ -1172,7 +1199,7 @@ def process_api_shorts_async(session_id, script, voice, speed, background_image_
                     return f"shorts_part_{segment_number}"
                 
                 # Clean the text and get first 10 words
-                words = re.sub(r'[^\w\s]', '', text).split()[:10]
+                words = _FILENAME_PUNCTUATION_PATTERN.sub('', text).split()[:10]
                 if not words:
                     return f"shorts_part_{segment_number}"
                 
@@ -1180,7 +1207,7 @@ def process_api_shorts_async(session_id, script, voice, speed, background_image_
                 filename_base = '_'.join(words).lower()
                 
                 # Remove any remaining unsafe characters and limit length
-                filename_base = re.sub(r'[^\w\-_]', '', filename_base)[:50]
+                filename_base = _FILENAME_UNSAFE_PATTERN.sub('', filename_base)[:50]
                 
                 # Ensure it's not empty after cleaning
                 if not filename_base:
@@ -1411,7 +1438,7 @@ def process_api_voiceover_async(session_id, script, voice, speed, format_type, b
                     return "voiceover"
                 
                 # Clean the text and get first 10 words
-                words = re.sub(r'[^\w\s]', '', text).split()[:10]
+                words = _FILENAME_PUNCTUATION_PATTERN.sub('', text).split()[:10]
                 if not words:
                     return "voiceover"
                 
@@ -1419,7 +1446,7 @@ def process_api_voiceover_async(session_id, script, voice, speed, format_type, b
                 filename_base = '_'.join(words).lower()
                 
                 # Remove any remaining unsafe characters and limit length
-                filename_base = re.sub(r'[^\w\-_]', '', filename_base)[:50]
+                filename_base = _FILENAME_UNSAFE_PATTERN.sub('', filename_base)[:50]
                 
                 # Ensure it's not empty after cleaning
                 if not filename_base:
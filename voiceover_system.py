@@ -1,32 +1,248 @@
 import os
+import queue
 import tempfile
 from openai import OpenAI
 import subprocess
 import uuid
 from pathlib import Path
-import json
 import shutil
 import re
+import hashlib
+import errno
+import stat
+import threading
+import time
+import wave
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+import httpx
 from werkzeug.utils import secure_filename
 
+# Optional header-only MP3 duration parsing; without it MP3 frames are walked in-process
+try:
+    from mutagen.mp3 import MP3 as _MutagenMP3
+except ImportError:
+    _MutagenMP3 = None
+
 # Removed unused Flask app and request imports to keep this module framework-agnostic
 
+# Process-wide OpenAI client. Every VoiceoverSystem shares it so TTS calls reuse
+# pooled keep-alive HTTPS connections instead of paying a fresh TCP+TLS
+# handshake per instance.
+_SHARED_OPENAI_CLIENT = None
+_SHARED_OPENAI_CLIENT_LOCK = threading.Lock()
+_TTS_HTTP_VERSION_LOGGED = False
+
+# Extensions accepted as background videos, as a tuple for str.endswith.
+_BACKGROUND_VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv')
+
+# Single-pass escaping for paths inside single quotes in an FFmpeg concat list.
+# Nothing is special inside quotes, so a quote is written as: close, escaped quote, reopen.
+_CONCAT_PATH_ESCAPE_TABLE = str.maketrans({"'": "'\\''"})
+
+# Single-pass escaping for a value inside an -filter_complex graph. Values are
+# unescaped twice (filter options, then the graph), so both tables are applied in order.
+_FILTER_OPTION_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', "'": "\\'", ':': '\\:'})
+_FILTERGRAPH_ESCAPE_TABLE = str.maketrans({
+    '\\': '\\\\', "'": "\\'", '[': '\\[', ']': '\\]', ',': '\\,', ';': '\\;'
+})
+
+# MIME types for generated files served by the download routes
+_DOWNLOAD_MIMETYPES = {
+    'mp3': 'audio/mpeg',
+    'wav': 'audio/wav',
+    'flac': 'audio/flac',
+    'aac': 'audio/aac',
+    'opus': 'audio/ogg',
+    'mp4': 'video/mp4',
+    'zip': 'application/zip',
+}
+
+# Names get_file_info will look up: plain names in the output folder only,
+# so traversal, hidden entries (.cache, .tmp) and oversized probes skip the stat
+_DOWNLOAD_FILENAME_PATTERN = re.compile(r'[A-Za-z0-9_\-][A-Za-z0-9._\-]{0,254}')
+
+# Hardware H.264 encoders, in order of preference, tried when VIDEO_ENCODER=auto
+_HW_H264_ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox')
+
+# Escaping for a command argument in a sendcmd file, applied after the filter option
+# escaping: a backslash protects quotes and the characters that end a command.
+_SENDCMD_ARG_ESCAPE_TABLE = str.maketrans({c: '\\' + c for c in "\\' \f\t\n\r,;"})
+
+# Name prefix of the per-video caption scratch dirs in the temp folder; cleanup
+# only ever removes directories carrying it.
+_CAPTIONS_DIR_PREFIX = 'captions_'
+
+# Characters that would start ASS override blocks or escapes in caption text
+_ASS_TEXT_TABLE = str.maketrans({'{': '(', '}': ')', '\\': '/'})
+
+# Leading "Chapter 3:"-style prefixes dropped from text-based filenames
+_FILENAME_PREFIX_PATTERN = re.compile(r'(chapter|part|section)\s*\d*[:\-\s]*', re.IGNORECASE)
+
+# Runs of non-whitespace, i.e. what str.split() returns
+_WORD_PATTERN = re.compile(r'\S+')
+
+# Pause markers in scripts: "— pause —" or "-- pause --"
+_PAUSE_MARKER_PATTERN = re.compile(r'(?:—\s*pause\s*—|--\s*pause\s*--)', re.IGNORECASE)
+
+# Sentence-ending punctuation used to break captions into sections
+_CAPTION_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+
+# Whitespace that follows sentence-ending punctuation
+_SENTENCE_END_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# Abbreviations that end with a period but do not end a sentence
+_SENTENCE_ABBREVIATIONS = {
+    'mr.', 'mrs.', 'ms.', 'dr.', 'prof.', 'sr.', 'jr.', 'st.', 'vs.',
+    'etc.', 'e.g.', 'i.e.', 'inc.', 'ltd.', 'co.', 'no.'
+}
+
+
+def _get_shared_openai_client(api_key):
+    """Return the shared OpenAI client, creating it on first use."""
+    global _SHARED_OPENAI_CLIENT
+    with _SHARED_OPENAI_CLIENT_LOCK:
+        if _SHARED_OPENAI_CLIENT is None:
+            # HTTP/2 lets concurrent TTS requests multiplex over one TLS connection;
+            # it needs the optional h2 package, so fall back to HTTP/1.1 pooling without it
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+            http_client = httpx.Client(
+                http2=http2,
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=16,
+                    max_connections=32,
+                    keepalive_expiry=60
+                )
+            )
+            _SHARED_OPENAI_CLIENT = OpenAI(api_key=api_key, http_client=http_client)
+        return _SHARED_OPENAI_CLIENT
+
+
+def _escape_filter_value(value):
+    """Escape a filter option value (e.g. a file path) for use in -filter_complex."""
+    return value.translate(_FILTER_OPTION_ESCAPE_TABLE).translate(_FILTERGRAPH_ESCAPE_TABLE)
+
+
+def _file_format(filename):
+    """Return the lowercase extension of a file name without the dot ('' if none)."""
+    # rpartition finds the suffix in one scan; a leading dot alone is not an extension
+    stem, _, suffix = filename.rpartition('.')
+    return suffix.lower() if stem else ''
+
+
+def _log_tts_http_version(response):
+    """Print the HTTP version of the first TTS response, to confirm HTTP/2 was negotiated."""
+    global _TTS_HTTP_VERSION_LOGGED
+    if _TTS_HTTP_VERSION_LOGGED:
+        return
+    _TTS_HTTP_VERSION_LOGGED = True
+    http_version = getattr(getattr(response, 'http_response', None), 'http_version', None)
+    if http_version:
+        print(f"🌐 TTS connection protocol: {http_version}")
+
+
+# MPEG audio Layer III header tables, indexed by the 2-bit version field
+# (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5) and the bitrate/sample rate indexes
+_MP3_BITRATES_KBPS = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    0: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+def _parse_mp3_frame_header(header):
+    """
+    Parse a 4-byte MPEG Layer III frame header.
+    
+    Returns:
+        tuple: (frame_length, samples_per_frame, sample_rate, channel_mode), or None if not a frame
+    """
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    
+    bitrate = _MP3_BITRATES_KBPS[version][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    padding = (header[2] >> 1) & 0x01
+    samples_per_frame = 1152 if version == 3 else 576
+    frame_length = samples_per_frame // 8 * bitrate // sample_rate + padding
+    return frame_length, samples_per_frame, sample_rate, header[3] >> 6
+
+
+def _id3v2_tag_size(head):
+    """Return the byte size of a leading ID3v2 tag given the first 10 bytes of a file."""
+    if len(head) < 10 or head[:3] != b'ID3':
+        return 0
+    # Tag size is a 28-bit synchsafe integer, excluding the 10-byte header and optional footer
+    size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+    footer = 10 if head[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+class _StreamParamsMismatch(ValueError):
+    """Audio parts differ in sample rate or channel layout, so they can't be stream-copied together."""
+
+
 class VoiceoverSystem:
     def __init__(self):
         # Initialize OpenAI client for Text-to-Speech
         api_key = os.getenv('OPENAI_API_KEY')
         if (api_key):
-            self.openai_client = OpenAI(api_key=api_key)
+            self.openai_client = _get_shared_openai_client(api_key)
         else:
             self.openai_client = None
         
         # Configure paths
         self.output_folder = os.getenv('VOICEOVER_FOLDER', 'voiceovers')
         os.makedirs(self.output_folder, exist_ok=True)
+        # Joined once so per-download lookups are a single concatenation
+        self._output_folder_prefix = os.path.join(self.output_folder, '')
+        # Reusable generated assets (backgrounds, etc.) live in a hidden subfolder
+        self.cache_folder = os.path.join(self.output_folder, '.cache')
+        os.makedirs(self.cache_folder, exist_ok=True)
+        # Intermediate audio is staged on the same filesystem as the outputs and the
+        # cache, so promoting it is an atomic rename and cache hits are hardlinks, not copies.
+        # VOICEOVER_TEMP_DIR can point it at a RAM-backed tmpfs (e.g. /dev/shm) instead;
+        # finished files are then copied out rather than renamed. Staging always goes in
+        # a dedicated subfolder there, since cleanup prunes everything old inside it.
+        temp_root = os.getenv('VOICEOVER_TEMP_DIR')
+        if temp_root:
+            self.temp_folder = os.path.join(temp_root, 'voiceover')
+        else:
+            self.temp_folder = os.path.join(self.output_folder, '.tmp')
+        os.makedirs(self.temp_folder, exist_ok=True)
         
         # Voice settings
+        # tts-1 starts returning audio faster; tts-1-hd trades latency for quality
+        self.tts_model = os.getenv('OPENAI_TTS_MODEL', 'tts-1')
         self.available_voices = ['alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer']
-        self.supported_formats = ['mp3', 'wav', 'mp4']
+        # Audio formats the OpenAI TTS API returns natively (no local transcode needed)
+        self.tts_native_formats = ['mp3', 'opus', 'aac', 'flac', 'wav']
+        self.supported_formats = self.tts_native_formats + ['mp4']
+        # Format requested from the API for mp4 output. MP3 and AAC are copied into the
+        # MP4 as-is; WAV/FLAC/Opus are encoded to AAC once at mux time.
+        self.video_tts_format = os.getenv('VOICEOVER_TTS_FORMAT', 'mp3').lower()
+        if self.video_tts_format not in self.tts_native_formats:
+            print(f"⚠️  Unsupported VOICEOVER_TTS_FORMAT '{self.video_tts_format}', using mp3")
+            self.video_tts_format = 'mp3'
+        # OpenAI TTS output is 24kHz mono; generated silence must match it to concat with -c copy
+        self.tts_output_sample_rate = 24000
         
         # Video generation settings - Support both formats
         # Regular format (landscape) - for Standalone AI Voiceover Generator
@@ -48,6 +264,8 @@ class VoiceoverSystem:
         # Support both folder-based (multiple videos) and single file configurations
         self.shorts_background_folder = os.getenv('SHORTS_BACKGROUND_FOLDER', 'backgrounds/shorts')
         self.regular_background_folder = os.getenv('REGULAR_BACKGROUND_FOLDER', 'backgrounds/regular')
+        # Folder listings keyed by path, reused until the directory's mtime changes
+        self._background_listing_cache = {}
         
         # Legacy single file support (fallback)
         self.shorts_background_video = os.getenv('SHORTS_BACKGROUND_VIDEO', 'shorts_background.mp4')
@@ -60,7 +278,9 @@ class VoiceoverSystem:
             self._validate_background_videos()
         
         # FFmpeg Quality Settings (Optimized for High Quality)
-        self.video_preset = os.getenv('VIDEO_PRESET', 'slow')  # slow = better quality, slower encoding
+        # CRF sets the quality; a slower preset mostly buys a smaller file, which short
+        # voiceover renders don't need, so default to medium rather than slow
+        self.video_preset = os.getenv('VIDEO_PRESET', 'medium')
         self.video_crf = int(os.getenv('VIDEO_CRF', '18'))  # 18 = visually lossless (0-51, lower=better)
         self.audio_bitrate = os.getenv('AUDIO_BITRATE', '256k')  # High quality audio
         self.audio_sample_rate = int(os.getenv('AUDIO_SAMPLE_RATE', 48000))  # 48kHz for professional quality
@@ -69,6 +289,12 @@ class VoiceoverSystem:
         self.video_profile = os.getenv('VIDEO_PROFILE', 'high')  # high, main, baseline
         self.video_level = os.getenv('VIDEO_LEVEL', '4.2')  # H.264 level
         self.video_tune = os.getenv('VIDEO_TUNE', 'animation')  # animation for text/graphics, film for video
+        # H.264 encoder: 'auto' probes for a working hardware encoder, or name one explicitly
+        self.video_encoder_preference = os.getenv('VIDEO_ENCODER', 'auto').lower()
+        self.video_hw_bitrate = os.getenv('VIDEO_HW_BITRATE', '6M')  # Only for encoders without a quality mode
+        self._video_encoder = None  # Resolved on first video
+        self._ffmpeg_filters = None  # Filter names of the installed FFmpeg, read on first use
+        self._video_prep_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='video-prep')
         
         # Text overlay settings
         self.text_overlay_enabled = os.getenv('VOICEOVER_TEXT_OVERLAY', 'true').lower() == 'true'
@@ -83,6 +309,45 @@ class VoiceoverSystem:
         self.pause_marker_fallback = '-- pause --'
         self.pause_silence_seconds = float(os.getenv('VOICEOVER_PAUSE_DURATION', 1.5))
         self.pause_enabled = os.getenv('VOICEOVER_ENABLE_PAUSES', 'true').lower() == 'true'
+        # Number of TTS requests allowed in flight at once
+        self.tts_concurrency = max(1, int(os.getenv('VOICEOVER_TTS_CONCURRENCY', 3)))
+        # Process-wide cap on TTS requests across all concurrent voiceover jobs,
+        # so parallel jobs don't multiply into OpenAI rate-limit errors
+        self.tts_max_inflight = max(1, int(os.getenv('VOICEOVER_TTS_MAX_INFLIGHT', 8)))
+        self._tts_request_slots = threading.BoundedSemaphore(self.tts_max_inflight)
+        
+        # Header-based duration readers by extension, chosen once; other formats use ffprobe.
+        # Without mutagen, MP3 frames are walked in-process instead.
+        self._duration_readers = {
+            '.wav': self._read_wav_duration,
+            '.mp3': self._read_mp3_duration_mutagen if _MutagenMP3 else self._scan_mp3_duration,
+        }
+        # Audio duration cache keyed by (path, mtime, size) so repeat lookups skip parsing
+        self._duration_cache = OrderedDict()
+        self._duration_cache_lock = threading.Lock()
+        self._duration_cache_max_entries = 256
+        # Download metadata keyed by filename, valid while (mtime, size) match
+        self._file_info_cache = OrderedDict()
+        self._file_info_cache_lock = threading.Lock()
+        self._file_info_cache_max_entries = 256
+        # Recently missed filenames, so repeated probes for absent files skip the stat
+        self._missing_files = OrderedDict()
+        self._missing_files_ttl = 2.0
+        self._missing_files_max_entries = 512
+        # Rendered silence clips keyed by (seconds, format)
+        self._silence_cache = {}
+        
+        # Content-addressed cache of synthesized TTS audio, so repeated text is not re-synthesized
+        self.tts_cache_enabled = os.getenv('VOICEOVER_TTS_CACHE', 'true').lower() == 'true'
+        self.tts_cache_folder = os.getenv('VOICEOVER_CACHE_DIR', self.cache_folder)
+        os.makedirs(self.tts_cache_folder, exist_ok=True)
+        # Size cap for cached TTS audio; least recently used entries are evicted first (0 = no cap)
+        self.tts_cache_max_bytes = int(os.getenv('VOICEOVER_CACHE_MAX_BYTES', 1024 ** 3))
+        self._tts_cache_evict_lock = threading.Lock()
+        self.cache_max_age_hours = float(os.getenv('VOICEOVER_CACHE_MAX_AGE_HOURS', 168))
+        # Deletions never block a caller: startup pruning and scratch-dir removal run here
+        self._cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='voiceover-cleanup')
+        self._cleanup_executor.submit(self.cleanup_old_files)
 
         # Video format configurations
         self.video_formats = {
@@ -98,6 +363,161 @@ class VoiceoverSystem:
             }
         }
     
+    def cleanup_old_files(self, max_age_hours=None):
+        """
+        Remove cached assets and leftover staging files/dirs older than max_age_hours.
+        
+        Only the hidden cache and temp folders are pruned; generated voiceovers are kept.
+        
+        Args:
+            max_age_hours: Age limit in hours (defaults to VOICEOVER_CACHE_MAX_AGE_HOURS)
+        
+        Returns:
+            int: Number of files removed
+        """
+        if max_age_hours is None:
+            max_age_hours = self.cache_max_age_hours
+        cutoff = time.time() - max_age_hours * 3600
+        removed = 0
+        
+        for folder in {self.cache_folder, self.tts_cache_folder, self.temp_folder}:
+            # VOICEOVER_CACHE_DIR may be a shared directory, so unless it is the
+            # module's own cache folder only the TTS entries written here are pruned
+            only_tts_entries = folder == self.tts_cache_folder and folder != self.cache_folder
+            try:
+                # scandir hands back cached file type info, so only one stat per entry is needed
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if only_tts_entries and not entry.name.startswith('tts_'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            # Caption scratch dirs left behind by an interrupted encode; any
+                            # other directory was not created here and is left alone
+                            if (folder == self.temp_folder
+                                    and entry.name.startswith(_CAPTIONS_DIR_PREFIX)
+                                    and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                                self._safe_rmtree(entry.path)
+                                removed += 1
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        # TTS cache hits bump only the access time (see _touch_tts_cache_entry)
+                        if max(entry_stat.st_atime, entry_stat.st_mtime) < cutoff:
+                            try:
+                                os.remove(entry.path)
+                                removed += 1
+                            except OSError:
+                                pass
+            except OSError as e:
+                print(f"⚠️  Cleanup of {folder} failed: {e}")
+        
+        if removed:
+            print(f"🧹 Removed {removed} cached files older than {max_age_hours}h")
+        return removed
+    
+    def get_file_info(self, filename, include_duration=True):
+        """
+        Get metadata for a generated file in the output folder.
+        
+        Costs one stat() per call; the rest is cached until the file's
+        mtime or size changes. Misses are remembered for a couple of seconds,
+        so clients polling for a missing file don't hit the filesystem each time.
+        
+        Args:
+            filename: File name inside the output folder
+            include_duration: Read the audio duration on a cache miss. Callers that
+                only need existence, size or MIME type (downloads) pass False to
+                skip the header parse / ffprobe; duration is then None unless cached.
+        
+        Returns:
+            dict: filename, path, size_bytes, format, mimetype and duration
+                  (seconds, or None for non-audio files), or None if not found
+        """
+        if not _DOWNLOAD_FILENAME_PATTERN.fullmatch(filename):
+            return None
+        
+        with self._file_info_cache_lock:
+            missed_at = self._missing_files.get(filename)
+            if missed_at is not None:
+                if time.monotonic() - missed_at < self._missing_files_ttl:
+                    return None
+                del self._missing_files[filename]
+        
+        file_path = self._output_folder_prefix + filename
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            with self._file_info_cache_lock:
+                self._missing_files[filename] = time.monotonic()
+                if len(self._missing_files) > self._missing_files_max_entries:
+                    self._missing_files.popitem(last=False)
+            return None
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        
+        version = (st.st_mtime_ns, st.st_size)
+        with self._file_info_cache_lock:
+            cached = self._file_info_cache.get(filename)
+            if cached and cached[0] == version:
+                self._file_info_cache.move_to_end(filename)
+                return dict(cached[1])
+        
+        if not include_duration:
+            # Not cached, so a later full lookup still fills in the duration
+            return self._build_file_info(filename, file_path, st, None)
+        
+        duration = None
+        if _file_format(filename) in self.tts_native_formats:
+            duration = self._lookup_audio_duration(file_path, st)
+        return dict(self._cache_file_info(filename, file_path, st, duration))
+    
+    def _build_file_info(self, filename, file_path, st, duration):
+        """Build the get_file_info metadata dict for a stat()ed file."""
+        file_format = _file_format(filename)
+        return {
+            'filename': filename,
+            'path': file_path,
+            'size_bytes': st.st_size,
+            'format': file_format,
+            'mimetype': _DOWNLOAD_MIMETYPES.get(file_format, 'application/octet-stream'),
+            'duration': duration
+        }
+    
+    def _cache_file_info(self, filename, file_path, st, duration):
+        """Build the get_file_info metadata for a stat()ed file and store it in the cache."""
+        info = self._build_file_info(filename, file_path, st, duration)
+        
+        with self._file_info_cache_lock:
+            self._missing_files.pop(filename, None)
+            self._file_info_cache[filename] = ((st.st_mtime_ns, st.st_size), info)
+            self._file_info_cache.move_to_end(filename)
+            if len(self._file_info_cache) > self._file_info_cache_max_entries:
+                self._file_info_cache.popitem(last=False)
+        return info
+    
+    def _on_file_written(self, filename, duration=None):
+        """
+        Record a file just written to the output folder in the metadata caches.
+        
+        Clears any cached miss and seeds get_file_info with the fresh stat and,
+        for audio, the already known duration, so the first download doesn't re-probe it.
+        """
+        file_path = self._output_folder_prefix + filename
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            with self._file_info_cache_lock:
+                self._missing_files.pop(filename, None)
+            return
+        if _file_format(filename) not in self.tts_native_formats:
+            duration = None
+        elif duration is not None:
+            self._remember_audio_duration(file_path, duration, st)
+        self._cache_file_info(filename, file_path, st, duration)
+    
     def _validate_background_videos(self):
         """Validate that background video files/folders exist and are accessible."""
         validation_errors = []
@@ -150,26 +570,32 @@ class VoiceoverSystem:
         Returns:
             list: List of full paths to video files, empty list if folder doesn't exist
         """
-        if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
+        try:
+            folder_stat = os.stat(folder_path)
+        except OSError:
+            return []
+        if not stat.S_ISDIR(folder_stat.st_mode):
             return []
         
-        # Supported video extensions
-        video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv'}
+        # Adding, removing or renaming an entry bumps the directory's mtime
+        cached = self._background_listing_cache.get(folder_path)
+        if cached and cached[0] == folder_stat.st_mtime_ns:
+            return list(cached[1])
         
-        video_files = []
         try:
-            for filename in os.listdir(folder_path):
-                file_path = os.path.join(folder_path, filename)
-                # Check if it's a file and has a video extension
-                if os.path.isfile(file_path):
-                    _, ext = os.path.splitext(filename)
-                    if ext.lower() in video_extensions:
-                        video_files.append(file_path)
+            # scandir entries carry their type, so most files need no extra stat
+            with os.scandir(folder_path) as entries:
+                video_files = [
+                    entry.path for entry in entries
+                    if entry.name.lower().endswith(_BACKGROUND_VIDEO_EXTENSIONS) and entry.is_file()
+                ]
         except Exception as e:
             print(f"Error reading folder {folder_path}: {str(e)}")
             return []
         
-        return sorted(video_files)  # Sort for consistency
+        video_files.sort()  # Sort for consistency
+        self._background_listing_cache[folder_path] = (folder_stat.st_mtime_ns, tuple(video_files))
+        return video_files
     
     def get_background_video_path(self, generation_type='youtube_shorts'):
         """
@@ -220,20 +646,24 @@ class VoiceoverSystem:
         if not text:
             return None
         
-        # Get the first line and clean it up
-        first_line = text.split('\n')[0].strip()
+        # Get the first line and clean it up (partition stops at the first newline
+        # instead of splitting the whole script into lines)
+        first_line = text.partition('\n')[0].strip()
         if not first_line:
             return None
         
         # Remove common prefixes and clean up
-        first_line = re.sub(r'^(chapter|part|section)\s*\d*[:\-\s]*', '', first_line, flags=re.IGNORECASE)
+        prefix_match = _FILENAME_PREFIX_PATTERN.match(first_line)
+        if prefix_match:
+            first_line = first_line[prefix_match.end():]
         
         # Limit length to avoid filesystem issues
         if len(first_line) > 50:
-            # Try to find a good breaking point
-            words = first_line.split()
+            # Try to find a good breaking point; words are matched lazily, since
+            # preprocessed scripts are one long line and only ~50 chars are needed
             truncated = ""
-            for word in words:
+            for word_match in _WORD_PATTERN.finditer(first_line):
+                word = word_match.group()
                 if len(truncated + " " + word) <= 50:
                     truncated = (truncated + " " + word).strip()
                 else:
@@ -284,7 +714,7 @@ class VoiceoverSystem:
             return []
         
         # Split text into sentences first (better for natural breaks)
-        sentences = re.split(r'[.!?]+', clean_text)
+        sentences = _CAPTION_SENTENCE_SPLIT_PATTERN.split(clean_text)
         sentences = [s.strip() for s in sentences if s.strip()]
         
         if not sentences:
@@ -292,27 +722,28 @@ class VoiceoverSystem:
         
         # Group sentences into sections based on character limit
         sections = []
-        current_section = ""
+        current_parts = []
+        current_len = 0
         
         for sentence in sentences:
             # Test if adding this sentence would exceed the limit
-            test_section = f"{current_section} {sentence}".strip()
-            
-            if len(test_section) <= max_chars_per_section:
-                current_section = test_section
+            test_len = current_len + 1 + len(sentence) if current_parts else len(sentence)
+            
+            if test_len <= max_chars_per_section:
+                current_parts.append(sentence)
+                current_len = test_len
+            elif current_parts:
+                # Save current section and start the next one with this sentence
+                sections.append(' '.join(current_parts))
+                current_parts = [sentence]
+                current_len = len(sentence)
             else:
-                # Save current section if it has content
-                if current_section:
-                    sections.append(current_section)
-                    current_section = sentence
-                else:
-                    # Single sentence is too long, force add it
-                    sections.append(sentence)
-                    current_section = ""
+                # Single sentence is too long, force add it
+                sections.append(sentence)
         
         # Add the last section if it has content
-        if current_section:
-            sections.append(current_section)
+        if current_parts:
+            sections.append(' '.join(current_parts))
         
         # If we have no sections, create one from the original text
         if not sections:
@@ -330,26 +761,25 @@ class VoiceoverSystem:
         print(f"📊 Text analysis: {len(sections)} sections, {total_words} total words")
         
         # Calculate timing for each section based on word count proportion
-        timed_sections = []
-        current_time = 0.0
+        section_durations = [duration * (word_count / total_words) for word_count in section_word_counts]
         
-        for i, (section_text, word_count) in enumerate(zip(sections, section_word_counts)):
-            # Calculate proportional duration based on word count
-            word_ratio = word_count / total_words
-            section_duration = duration * word_ratio
-            
-            start_time = current_time
-            end_time = current_time + section_duration
-            
-            timed_sections.append({
+        # Running end times in one C-level pass; the last one is pinned to the audio
+        # duration so accumulated float error can't end the final caption early
+        section_ends = list(accumulate(section_durations))
+        section_ends[-1] = duration
+        section_starts = [0.0] + section_ends[:-1]
+        
+        timed_sections = [
+            {
                 'text': section_text,
                 'start': start_time,
                 'end': end_time,
                 'word_count': word_count,
                 'duration': section_duration
-            })
-            
-            current_time = end_time
+            }
+            for section_text, word_count, section_duration, start_time, end_time
+            in zip(sections, section_word_counts, section_durations, section_starts, section_ends)
+        ]
         
         # Log the timing breakdown
         print(f"⏱️  Proportional timing breakdown:")
@@ -361,46 +791,40 @@ class VoiceoverSystem:
         
         return timed_sections
     
-    def _build_timed_drawtext_chain(self, input_label, captions):
-        """Build FFmpeg drawtext filter chain with timed captions and proper text wrapping."""
-        if not captions:
-            return "", input_label
+    def _wrap_caption_text(self, text, max_chars_per_line):
+        """
+        Wrap text to fit within video width with better word breaking.
+        """
+        if len(text) <= max_chars_per_line:
+            return [text]
         
-        # Wrap text to fit video width
-        def wrap_text_for_video(text, max_chars_per_line):
-            """
-            Wrap text to fit within video width with better word breaking.
-            """
-            if len(text) <= max_chars_per_line:
-                return [text]
-            
-            words = text.split()
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                # Test if adding this word would exceed the limit
-                test_line = f"{current_line} {word}".strip()
-                
-                if len(test_line) <= max_chars_per_line:
-                    current_line = test_line
-                else:
-                    # If current_line has content, save it and start new line
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = word
-                    else:
-                        # Word itself is too long, force break it
-                        current_line = word
-            
-            # Add the last line if it has content
-            if current_line:
-                lines.append(current_line)
-            
-            return lines
+        lines = []
+        current_parts = []
+        current_len = 0
         
-        # Font settings
-        fontfile = self.text_overlay_font_path if self.text_overlay_font_path else ''
+        for word in text.split():
+            # Test if adding this word would exceed the limit
+            test_len = current_len + 1 + len(word) if current_parts else len(word)
+            
+            if test_len <= max_chars_per_line:
+                current_parts.append(word)
+                current_len = test_len
+            else:
+                # Save the current line and start a new one; a word that is too
+                # long by itself still gets a line of its own
+                if current_parts:
+                    lines.append(' '.join(current_parts))
+                current_parts = [word]
+                current_len = len(word)
+        
+        # Add the last line if it has content
+        if current_parts:
+            lines.append(' '.join(current_parts))
+        
+        return lines
+
+    def _caption_max_chars(self):
+        """Estimate how many caption characters fit on one line of the current video size."""
         fontsize = self.text_overlay_fontsize_px
         margin = self.text_overlay_side_margin_px
         
@@ -413,65 +837,131 @@ class VoiceoverSystem:
             max_chars = min(max_chars, 22)
         else:  # Landscape (Regular videos)
             max_chars = min(max_chars, 35)
+        return max_chars
+
+    def _ffmpeg_has_filter(self, filter_name):
+        """Return True if the installed FFmpeg provides the given filter (checked once per process)."""
+        if self._ffmpeg_filters is None:
+            try:
+                result = subprocess.run(['ffmpeg', '-hide_banner', '-filters'], capture_output=True, text=True)
+                # Lines look like " T.. ass   V->V   Render ASS subtitles ..."
+                self._ffmpeg_filters = {
+                    fields[1] for fields in (line.split() for line in result.stdout.splitlines())
+                    if len(fields) > 2
+                }
+            except OSError:
+                self._ffmpeg_filters = set()
+        return filter_name in self._ffmpeg_filters
+
+    def _write_ass_subtitles(self, captions, subtitles_path):
+        """
+        Write timed captions as an ASS subtitle file styled like the drawtext captions.
         
-        print(f"Text overlay settings: fontsize={fontsize}, max_chars={max_chars}, video={self.video_width}x{self.video_height}")
+        Args:
+            captions: List of dicts with 'text', 'start' and 'end' (seconds)
+            subtitles_path: Destination .ass file
+        """
+        def ass_time(seconds):
+            centiseconds = int(round(seconds * 100))
+            hours, centiseconds = divmod(centiseconds, 360000)
+            minutes, centiseconds = divmod(centiseconds, 6000)
+            secs, centiseconds = divmod(centiseconds, 100)
+            return f"{hours}:{minutes:02d}:{secs:02d}.{centiseconds:02d}"
         
-        # Build drawtext filters for each caption
-        drawtext_filters = []
-        for i, cap in enumerate(captions):
-            # Wrap text into multiple lines
-            text_lines = wrap_text_for_video(cap['text'], max_chars)
-            
-            start = cap['start']
-            end = cap['end']
-            
-            # Join lines with newline - NO ESCAPING needed for textfile approach
-            display_text = '\n'.join(text_lines)
-            
-            # Create a temporary text file for this caption to avoid escaping issues
-            import tempfile
-            text_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8')
-            text_file.write(display_text)
-            text_file.close()
-            
-            # Enable expression: show between start and end times
-            enable_expr = f"between(t,{start},{end})"
-            
-            # Build drawtext filter using textfile instead of text parameter
-            dt_parts = [
-                f"textfile='{text_file.name}'",  # Use text file instead of inline text
-                f"fontsize={fontsize}",
-                "fontcolor=white",
-                "bordercolor=black", 
-                "borderw=3",
-                "box=1",
-                "boxcolor=black@0.5",
-                "boxborderw=15",
-                "line_spacing=8",
-                f"x=(w-text_w)/2",
-                f"y=h*0.85-text_h",
-                f"enable='{enable_expr}'"
-            ]
-            
-            if fontfile and os.path.exists(fontfile):
-                dt_parts.insert(1, f"fontfile='{fontfile}'")
-            
-            # Build the complete filter
-            filter_params = ':'.join(dt_parts)
-            full_filter = filter_params
-            
-            drawtext_filters.append(full_filter)
+        margin = self.text_overlay_side_margin_px
+        # drawtext puts the caption's bottom edge at 85% of the frame height
+        margin_v = int(self.video_height * 0.15)
+        
+        lines = [
+            "[Script Info]",
+            "ScriptType: v4.00+",
+            f"PlayResX: {self.video_width}",
+            f"PlayResY: {self.video_height}",
+            # libass wraps with the real font metrics, within the side margins
+            "WrapStyle: 0",
+            "ScaledBorderAndShadow: yes",
+            "",
+            "[V4+ Styles]",
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+            "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, "
+            "Shadow, Alignment, MarginL, MarginR, MarginV, Encoding",
+            # White text on a half-transparent black box (BorderStyle 3), bottom centered
+            f"Style: Caption,Sans,{self.text_overlay_fontsize_px},&H00FFFFFF,&H00FFFFFF,&H80000000,&H80000000,"
+            f"0,0,0,0,100,100,0,0,3,15,0,2,{margin},{margin},{margin_v},1",
+            "",
+            "[Events]",
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+        ]
+        for cap in captions:
+            # Whitespace is collapsed so a stray newline can't end the Dialogue line
+            text = ' '.join(cap['text'].split()).translate(_ASS_TEXT_TABLE)
+            lines.append(f"Dialogue: 0,{ass_time(cap['start'])},{ass_time(cap['end'])},Caption,,0,0,0,,{text}")
+        
+        with open(subtitles_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def _build_timed_drawtext_chain(self, input_label, captions, text_dir=None):
+        """
+        Build an FFmpeg drawtext filter with timed captions and proper text wrapping.
+        
+        The sendcmd file that switches captions is written to text_dir (the temp
+        folder by default); the caller removes it once the encode is done.
+        """
+        if not captions:
+            return "", input_label
         
-        # Chain all drawtext filters
-        current_label = input_label.strip('[]')
-        filter_chain_parts = []
+        # Font settings
+        fontfile = self.text_overlay_font_path if self.text_overlay_font_path else ''
+        fontsize = self.text_overlay_fontsize_px
+        max_chars = self._caption_max_chars()
         
-        for i, dt_filter in enumerate(drawtext_filters):
-            next_label = f"txt{i}"
-            filter_chain_parts.append(f"[{current_label}]drawtext={dt_filter}[{next_label}]")
-            current_label = next_label
+        print(f"Text overlay settings: fontsize={fontsize}, max_chars={max_chars}, video={self.video_width}x{self.video_height}")
         
-        return ';'.join(filter_chain_parts), f"[{current_label}]"
+        # Styling is identical for every caption, so build it (and check the font) once
+        style_parts = [
+            f"fontsize={fontsize}",
+            "fontcolor=white",
+            "bordercolor=black", 
+            "borderw=3",
+            "box=1",
+            "boxcolor=black@0.5",
+            "boxborderw=15",
+            "line_spacing=8",
+            f"x=(w-text_w)/2",
+            f"y=h*0.85-text_h"
+        ]
+        if fontfile and os.path.exists(fontfile):
+            style_parts.insert(0, f"fontfile={_escape_filter_value(fontfile)}")
+        style_params = ':'.join(style_parts)
+        
+        # One drawtext node shows every caption: sendcmd swaps its text at each
+        # caption's start, so per-frame cost doesn't grow with the caption count.
+        # Captions are contiguous from t=0, so the first one is the initial text.
+        caption_texts = [
+            '\n'.join(self._wrap_caption_text(cap['text'], max_chars)) for cap in captions
+        ]
+        drawtext_filter = (
+            f"drawtext@captions=text={_escape_filter_value(caption_texts[0])}:expansion=none:{style_params}"
+        )
+        
+        label = input_label.strip('[]')
+        if len(captions) == 1:
+            return f"[{label}]{drawtext_filter}[txt]", "[txt]"
+        
+        commands = [
+            f"{cap['start']:.3f} drawtext@captions reinit "
+            f"text={text.translate(_FILTER_OPTION_ESCAPE_TABLE).translate(_SENDCMD_ARG_ESCAPE_TABLE)};"
+            for cap, text in zip(captions[1:], caption_texts[1:])
+        ]
+        commands_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.cmd', encoding='utf-8',
+                                                    dir=text_dir or self.temp_folder)
+        with commands_file:
+            commands_file.write('\n'.join(commands) + '\n')
+        
+        return (
+            f"[{label}]sendcmd=f={_escape_filter_value(commands_file.name)},{drawtext_filter}[txt]",
+            "[txt]"
+        )
     
     # def _build_timed_drawtext_chain(self, input_label, captions):
     #     """Build FFmpeg drawtext filter chain with timed captions and proper text wrapping."""
@@ -611,51 +1101,462 @@ class VoiceoverSystem:
             return [text]
         
         # Split text into sentences for natural boundaries
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENTENCE_END_PATTERN.split(text)
         
+        # Collect parts and track the joined length, so each chunk is built with
+        # a single join instead of re-copying a growing string per sentence
         chunks = []
-        current_chunk = ""
+        current_parts = []
+        current_len = 0
         
         for sentence in sentences:
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            
             # Test if adding this sentence would exceed the limit
-            test_chunk = f"{current_chunk} {sentence}".strip()
+            test_len = current_len + 1 + len(sentence) if current_parts else len(sentence)
             
-            if len(test_chunk) <= max_chars:
-                current_chunk = test_chunk
+            if test_len <= max_chars:
+                current_parts.append(sentence)
+                current_len = test_len
             else:
                 # Save current chunk if it has content
-                if current_chunk:
-                    chunks.append(current_chunk)
+                if current_parts:
+                    chunks.append(' '.join(current_parts))
                 
                 # If single sentence is too long, force split it
                 if len(sentence) > max_chars:
                     # Split long sentence by words
-                    words = sentence.split()
-                    word_chunk = ""
+                    word_parts = []
+                    word_len = 0
                     
-                    for word in words:
-                        test_word_chunk = f"{word_chunk} {word}".strip()
-                        if len(test_word_chunk) <= max_chars:
-                            word_chunk = test_word_chunk
+                    for word in sentence.split():
+                        test_word_len = word_len + 1 + len(word) if word_parts else len(word)
+                        if test_word_len <= max_chars:
+                            word_parts.append(word)
+                            word_len = test_word_len
                         else:
-                            if word_chunk:
-                                chunks.append(word_chunk)
-                            word_chunk = word
+                            if word_parts:
+                                chunks.append(' '.join(word_parts))
+                            word_parts = [word]
+                            word_len = len(word)
                     
-                    if word_chunk:
-                        current_chunk = word_chunk
-                    else:
-                        current_chunk = ""
+                    current_parts = word_parts
+                    current_len = word_len
                 else:
-                    current_chunk = sentence
+                    current_parts = [sentence]
+                    current_len = len(sentence)
         
         # Add the last chunk if it has content
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_parts:
+            chunks.append(' '.join(current_parts))
         
         return chunks
 
-    def _generate_multiple_audio_chunks(self, text_chunks, voice, speed, session_id):
+    def _stream_tts_to_file(self, text, voice, speed, output_path, response_format='mp3'):
+        """
+        Stream OpenAI TTS audio straight to disk as it is generated.
+
+        Uses the streaming endpoint so the first bytes hit the file as soon as
+        the model produces them instead of after the whole clip is buffered.
+
+        Args:
+            text: Text to convert
+            voice: Voice to use
+            speed: Speech speed
+            output_path: Destination file path
+            response_format: Audio format requested from the API
+        """
+        cache_path = self._get_tts_cache_path(text, voice, speed, response_format)
+        if cache_path and os.path.exists(cache_path) and os.path.getsize(cache_path) > 0:
+            self._link_or_copy(cache_path, output_path)
+            self._touch_tts_cache_entry(cache_path)
+            print(f"♻️  TTS cache hit: {os.path.basename(cache_path)}")
+            return
+        
+        with self._tts_request_slots, self.openai_client.audio.speech.with_streaming_response.create(
+            model=self.tts_model,
+            voice=voice,
+            input=text,
+            speed=speed,
+            response_format=response_format
+        ) as response:
+            _log_tts_http_version(response)
+            # A file already at output_path may be a hardlink to a cache entry (a
+            # leftover or a concurrent job's output), so never write into it:
+            # stream to a fresh file and rename it over
+            temp_output_path = f"{output_path}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                # Large blocks keep the write loop to a few syscalls per clip
+                with open(temp_output_path, 'wb') as f:
+                    for block in response.iter_bytes(65536):
+                        f.write(block)
+                os.replace(temp_output_path, output_path)
+            finally:
+                if os.path.exists(temp_output_path):
+                    os.remove(temp_output_path)
+        
+        if cache_path:
+            self._store_in_tts_cache(output_path, cache_path)
+
+    def _get_tts_cache_path(self, text, voice, speed, response_format):
+        """Return the cache file path for a TTS request, or None if caching is disabled."""
+        if not self.tts_cache_enabled:
+            return None
+        # Whitespace runs don't change the synthesized speech, so re-typed or
+        # re-wrapped copies of the same text share one entry
+        normalized_text = ' '.join(text.split())
+        key = hashlib.sha256(
+            f"{self.tts_model}|{voice}|{speed}|{response_format}|{normalized_text}".encode('utf-8')
+        ).hexdigest()
+        return os.path.join(self.tts_cache_folder, f"tts_{key}.{response_format}")
+
+    def _touch_tts_cache_entry(self, cache_path):
+        """
+        Mark a TTS cache entry as just used, for LRU eviction and age-based cleanup.
+        
+        Entries share an inode with the outputs they were linked into, so only
+        the access time is bumped; the delivered files keep their mtime.
+        """
+        try:
+            os.utime(cache_path, (time.time(), os.stat(cache_path).st_mtime))
+        except OSError:
+            pass
+
+    def _link_or_copy(self, source_path, dest_path):
+        """
+        Hardlink source_path to dest_path, copying instead across filesystems.
+        
+        Callers only ever unlink or replace the linked files, never rewrite them
+        in place, so sharing an inode with a cache entry is safe.
+        """
+        if os.path.lexists(dest_path):
+            os.remove(dest_path)
+        try:
+            os.link(source_path, dest_path)
+        except OSError:
+            shutil.copyfile(source_path, dest_path)
+
+    def _move_into_place(self, source_path, dest_path):
+        """
+        Atomically move a finished file to its destination.
+        
+        Renames when both paths share a filesystem; otherwise (a tmpfs
+        VOICEOVER_TEMP_DIR) copies next to the destination and renames there,
+        so readers never see a partial file.
+        """
+        try:
+            os.replace(source_path, dest_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            temp_dest_path = f"{dest_path}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                shutil.copyfile(source_path, temp_dest_path)
+                os.replace(temp_dest_path, dest_path)
+            finally:
+                if os.path.exists(temp_dest_path):
+                    os.remove(temp_dest_path)
+            os.remove(source_path)
+
+    def _store_in_tts_cache(self, audio_path, cache_path):
+        """Link freshly synthesized audio into the TTS cache without failing the request."""
+        temp_cache_path = f"{cache_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            self._link_or_copy(audio_path, temp_cache_path)
+            # Atomic rename so concurrent readers never see a partial cache entry
+            os.replace(temp_cache_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  Could not store TTS cache entry: {e}")
+            if os.path.exists(temp_cache_path):
+                os.remove(temp_cache_path)
+        self._evict_tts_cache()
+
+    def _evict_tts_cache(self):
+        """Remove least recently used TTS cache entries until the cache fits VOICEOVER_CACHE_MAX_BYTES."""
+        if self.tts_cache_max_bytes <= 0:
+            return
+        # One scan at a time is enough; a concurrent store will trigger the next one
+        if not self._tts_cache_evict_lock.acquire(blocking=False):
+            return
+        try:
+            entries = []
+            total_bytes = 0
+            with os.scandir(self.tts_cache_folder) as scan:
+                for entry in scan:
+                    if entry.name.startswith('tts_') and entry.is_file(follow_symlinks=False):
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        # Cache hits bump the access time, so the later of atime/mtime is last use
+                        last_used = max(entry_stat.st_atime, entry_stat.st_mtime)
+                        entries.append((last_used, entry_stat.st_size, entry.path))
+                        total_bytes += entry_stat.st_size
+            
+            if total_bytes <= self.tts_cache_max_bytes:
+                return
+            entries.sort()
+            for _, size, path in entries:
+                try:
+                    os.remove(path)
+                    total_bytes -= size
+                except OSError:
+                    pass
+                if total_bytes <= self.tts_cache_max_bytes:
+                    break
+        except OSError as e:
+            print(f"⚠️  TTS cache eviction failed: {e}")
+        finally:
+            self._tts_cache_evict_lock.release()
+
+    def generate_speech_stream(self, text, voice='onyx', speed=1.2, chunk_size=4096):
+        """
+        Generate MP3 speech and yield it incrementally as the API streams it.
+
+        Intended for HTTP consumers that want to start playback before the
+        whole script has been synthesized (e.g. Flask's stream_with_context).
+        Pause markers are streamed as the cached silence clip.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use
+            speed: Speech speed (0.25 to 4.0)
+            chunk_size: Size of the byte chunks yielded
+
+        Yields:
+            bytes: Consecutive pieces of the MP3 stream
+        """
+        if not self.openai_client:
+            raise ValueError('OpenAI API key not configured')
+        if not text or not text.strip():
+            raise ValueError('Text is required')
+        if voice not in self.available_voices:
+            raise ValueError(f'Invalid voice. Use: {", ".join(self.available_voices)}')
+        if not (0.25 <= speed <= 4.0):
+            raise ValueError('Speed must be between 0.25 and 4.0')
+
+        processed_text = self._preprocess_text_for_tts(text)
+
+        if self.pause_enabled:
+            segments = self._split_on_pause_markers(processed_text)
+        else:
+            segments = [processed_text]
+
+        # Synthesize sentence by sentence so the first audio is ready after the
+        # first sentence instead of after the whole script; None marks a pause
+        sentences = []
+        for i, segment in enumerate(segments):
+            if i > 0 and self.pause_silence_seconds > 0:
+                sentences.append(None)
+            for sentence in self._split_sentences(segment):
+                sentences.extend(self._chunk_text_for_tts(sentence, self.max_input_chars - 100))
+
+        def read_silence():
+            silence_path = self._generate_silence('mp3')
+            if not silence_path:
+                return b''
+            with open(silence_path, 'rb') as f:
+                silence = f.read()
+            # Drop the ID3 tag so it doesn't land mid-stream
+            return silence[_id3v2_tag_size(silence[:10]):]
+
+        executor = ThreadPoolExecutor(max_workers=self.tts_concurrency)
+        try:
+            silence_future = executor.submit(read_silence) if None in sentences else None
+            # The first sentence is relayed straight from the API response (see below);
+            # the rest are prefetched in the background meanwhile
+            futures = [
+                silence_future if sentence is None
+                else None if i == 0
+                else executor.submit(self._fetch_tts_bytes, sentence, voice, speed)
+                for i, sentence in enumerate(sentences)
+            ]
+            # MP3 frames are self-delimiting, so sentence clips can be sent back to back
+            for i, future in enumerate(futures):
+                if future is None:
+                    # Forward bytes as they arrive, so playback starts within the first response
+                    yield from self._iter_tts_bytes(sentences[i], voice, speed, chunk_size)
+                    continue
+                audio = future.result()
+                for offset in range(0, len(audio), chunk_size):
+                    yield audio[offset:offset + chunk_size]
+        finally:
+            # Stop pending requests if the consumer goes away early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def synthesize_many(self, texts, voice, speed, output_paths, response_format='mp3'):
+        """
+        Synthesize several texts concurrently, one output file per text.
+        
+        Requests share the pooled OpenAI client and run up to
+        tts_concurrency at a time, so total latency tracks the slowest
+        request rather than the sum of all of them.
+        
+        Args:
+            texts: List of text strings to convert
+            voice: Voice to use
+            speed: Speech speed
+            output_paths: List of destination paths, parallel to texts
+            response_format: Audio format requested from the API
+        
+        Returns:
+            list: One entry per text: None if its file was written successfully,
+                  otherwise the error message
+        """
+        if len(texts) != len(output_paths):
+            raise ValueError('texts and output_paths must have the same length')
+        
+        def synthesize_one(index):
+            try:
+                self._stream_tts_to_file(texts[index], voice, speed, output_paths[index], response_format)
+                if not os.path.exists(output_paths[index]) or os.path.getsize(output_paths[index]) == 0:
+                    return 'TTS returned no audio'
+                return None
+            except Exception as e:
+                print(f"   ❌ TTS request {index+1}/{len(texts)} failed: {e}")
+                return str(e)
+        
+        if len(texts) <= 1:
+            return [synthesize_one(i) for i in range(len(texts))]
+        
+        with ThreadPoolExecutor(max_workers=min(self.tts_concurrency, len(texts))) as executor:
+            return list(executor.map(synthesize_one, range(len(texts))))
+
+    def _split_sentences(self, text, min_chars=40):
+        """
+        Split text on sentence boundaries for incremental synthesis.
+        
+        Periods after common abbreviations do not end a sentence, and fragments
+        shorter than min_chars are merged with their neighbour so each request
+        carries enough context for natural prosody.
+        
+        Args:
+            text: Text to split
+            min_chars: Minimum characters per sentence group
+        
+        Returns:
+            list: List of sentence strings
+        """
+        sentences = []
+        buffer = []
+        buffer_len = 0
+        
+        for piece in _SENTENCE_END_PATTERN.split(text.strip()):
+            piece = piece.strip()
+            if not piece:
+                continue
+            buffer_len += len(piece) + 1 if buffer else len(piece)
+            buffer.append(piece)
+            last_word = piece.rsplit(None, 1)[-1].lower()
+            if last_word in _SENTENCE_ABBREVIATIONS or buffer_len < min_chars:
+                continue
+            sentences.append(' '.join(buffer))
+            buffer = []
+            buffer_len = 0
+        
+        if buffer:
+            if sentences and buffer_len < min_chars:
+                sentences[-1] = f"{sentences[-1]} {' '.join(buffer)}"
+            else:
+                sentences.append(' '.join(buffer))
+        
+        return sentences
+
+    def _fetch_tts_bytes(self, text, voice, speed, response_format='mp3'):
+        """Synthesize text with the streaming endpoint and return the audio bytes."""
+        cache_path = self._get_tts_cache_path(text, voice, speed, response_format)
+        if cache_path and os.path.exists(cache_path) and os.path.getsize(cache_path) > 0:
+            self._touch_tts_cache_entry(cache_path)
+            with open(cache_path, 'rb') as f:
+                return f.read()
+        
+        with self._tts_request_slots, self.openai_client.audio.speech.with_streaming_response.create(
+            model=self.tts_model,
+            voice=voice,
+            input=text,
+            speed=speed,
+            response_format=response_format
+        ) as response:
+            _log_tts_http_version(response)
+            audio = response.read()
+        
+        if cache_path:
+            self._store_bytes_in_tts_cache(audio, cache_path)
+        
+        return audio
+
+    def _iter_tts_bytes(self, text, voice, speed, chunk_size=4096, response_format='mp3'):
+        """
+        Yield TTS audio as the API streams it, caching the full clip once it completes.
+        
+        A worker thread drains the API response into an unbounded queue, so the
+        TTS request slot and the upstream connection are released as soon as the
+        clip is received, however slowly the consumer reads. Closing the generator
+        early (client disconnect) makes the worker close the response.
+        """
+        cache_path = self._get_tts_cache_path(text, voice, speed, response_format)
+        if cache_path and os.path.exists(cache_path) and os.path.getsize(cache_path) > 0:
+            self._touch_tts_cache_entry(cache_path)
+            with open(cache_path, 'rb') as f:
+                for block in iter(lambda: f.read(chunk_size), b''):
+                    yield block
+            return
+        
+        # A single sentence's clip is small, so the queue is never bounded: the
+        # worker must not wait on the consumer while it holds a request slot
+        blocks = queue.Queue()
+        cancelled = threading.Event()
+        
+        def receive():
+            try:
+                with self._tts_request_slots, self.openai_client.audio.speech.with_streaming_response.create(
+                    model=self.tts_model,
+                    voice=voice,
+                    input=text,
+                    speed=speed,
+                    response_format=response_format
+                ) as response:
+                    _log_tts_http_version(response)
+                    for block in response.iter_bytes(chunk_size):
+                        if cancelled.is_set():
+                            return
+                        blocks.put(block)
+                blocks.put(None)
+            except Exception as e:
+                blocks.put(e)
+        
+        threading.Thread(target=receive, daemon=True, name='tts-stream').start()
+        
+        received = []
+        try:
+            while True:
+                block = blocks.get()
+                if block is None:
+                    break
+                if isinstance(block, Exception):
+                    raise block
+                received.append(block)
+                yield block
+        finally:
+            cancelled.set()
+        
+        if cache_path:
+            self._store_bytes_in_tts_cache(b''.join(received), cache_path)
+
+    def _store_bytes_in_tts_cache(self, audio, cache_path):
+        """Write synthesized audio bytes into the TTS cache without failing the request."""
+        temp_cache_path = f"{cache_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            with open(temp_cache_path, 'wb') as f:
+                f.write(audio)
+            # Atomic rename so concurrent readers never see a partial cache entry
+            os.replace(temp_cache_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  Could not store TTS cache entry: {e}")
+            if os.path.exists(temp_cache_path):
+                os.remove(temp_cache_path)
+        self._evict_tts_cache()
+
+    def _generate_multiple_audio_chunks(self, text_chunks, voice, speed, session_id, audio_format='mp3'):
         """
         Generate multiple audio files from text chunks and combine them.
         
@@ -664,6 +1565,7 @@ class VoiceoverSystem:
             voice: Voice to use
             speed: Speech speed
             session_id: Session ID for file naming
+            audio_format: Audio format requested from the TTS API
         
         Returns:
             tuple: (success: bool, combined_audio_path: str, total_duration: float, error_msg: str)
@@ -674,81 +1576,89 @@ class VoiceoverSystem:
             temp_audio_files = []
             total_duration = 0
             
-            # Generate audio for each chunk
-            for i, chunk in enumerate(text_chunks):
-                print(f"   Generating chunk {i+1}/{len(text_chunks)} ({len(chunk)} chars)...")
-                
-                chunk_filename = f"{session_id}_chunk_{i+1}.mp3"
-                chunk_path = os.path.join(tempfile.gettempdir(), chunk_filename)
-                
+            combined_filename = f"{session_id}_combined.{audio_format}"
+            combined_path = os.path.join(self.temp_folder, combined_filename)
+            
+            # MP3 chunks join frame by frame, so append each response straight into
+            # the combined file instead of round-tripping through chunk files.
+            # Requests run concurrently and each chunk is appended as soon as it and
+            # its predecessors are in, so writing overlaps the remaining downloads.
+            if audio_format == 'mp3':
+                chunk_error_msg = None
+                executor = ThreadPoolExecutor(max_workers=min(self.tts_concurrency, len(text_chunks)))
                 try:
-                    # Generate TTS for this chunk
-                    response = self.openai_client.audio.speech.create(
-                        model="tts-1",
-                        voice=voice,
-                        input=chunk,
-                        speed=speed,
-                        response_format="mp3"
-                    )
-                    
-                    # Save chunk audio
-                    with open(chunk_path, 'wb') as f:
-                        f.write(response.content)
-                    
-                    # Verify file was created
-                    if not os.path.exists(chunk_path) or os.path.getsize(chunk_path) == 0:
-                        raise Exception(f"Failed to create audio chunk {i+1}")
-                    
-                    # Get duration of this chunk
-                    chunk_duration = self._get_audio_duration(chunk_path)
-                    total_duration += chunk_duration
-                    
-                    temp_audio_files.append(chunk_path)
-                    print(f"   ✅ Chunk {i+1} generated: {chunk_duration:.1f}s")
-                    
-                except Exception as chunk_error:
-                    # Cleanup any files created so far
-                    for temp_file in temp_audio_files:
-                        if os.path.exists(temp_file):
-                            os.remove(temp_file)
-                    return False, None, 0, f"Failed to generate audio chunk {i+1}: {str(chunk_error)}"
+                    futures = [
+                        executor.submit(self._fetch_tts_bytes, chunk, voice, speed, audio_format)
+                        for chunk in text_chunks
+                    ]
+                    stream_params = None
+                    with open(combined_path, 'wb') as combined_file:
+                        for i, future in enumerate(futures):
+                            # Drop the list's reference so appended chunks can be freed;
+                            # only chunks that finished ahead of their turn stay buffered
+                            futures[i] = None
+                            try:
+                                audio = future.result()
+                            except Exception as chunk_error:
+                                chunk_error_msg = f"Failed to generate audio chunk {i+1}: {str(chunk_error)}"
+                                break
+                            stream_params = self._append_mp3_data(
+                                combined_file, audio, stream_params, f"chunk {i+1}"
+                            )
+                            # Duration comes from the bytes in hand, so the joined file is never re-read
+                            chunk_duration = self._mp3_data_duration(audio) or 0
+                            total_duration += chunk_duration
+                            print(f"   ✅ Chunk {i+1}/{len(text_chunks)} appended: {chunk_duration:.1f}s")
+                except ValueError as e:
+                    print(f"⚠️  MP3 append failed, falling back to chunk files: {e}")
+                    os.remove(combined_path)
+                    total_duration = 0
+                else:
+                    if chunk_error_msg:
+                        os.remove(combined_path)
+                        return False, None, 0, chunk_error_msg
+                    self._remember_audio_duration(combined_path, total_duration)
+                    print(f"✅ Audio chunks combined successfully: {total_duration:.1f}s total")
+                    return True, combined_path, total_duration, None
+                finally:
+                    # Drop queued requests after a failure; in-flight ones still land in the cache
+                    executor.shutdown(wait=False, cancel_futures=True)
+            
+            # Other formats go through chunk files, synthesized concurrently
+            chunk_paths = [
+                os.path.join(self.temp_folder, f"{session_id}_chunk_{i+1}.{audio_format}")
+                for i in range(len(text_chunks))
+            ]
+            print(f"   Generating {len(text_chunks)} chunks ({min(self.tts_concurrency, len(text_chunks))} at a time)...")
+            chunk_errors = self.synthesize_many(text_chunks, voice, speed, chunk_paths, audio_format)
+            
+            failed_chunks = [i for i, error in enumerate(chunk_errors) if error]
+            if failed_chunks:
+                # Cleanup any files created
+                for chunk_path in chunk_paths:
+                    if os.path.exists(chunk_path):
+                        os.remove(chunk_path)
+                first_failed = failed_chunks[0]
+                return False, None, 0, f"Failed to generate audio chunk {first_failed+1}: {chunk_errors[first_failed]}"
+            
+            temp_audio_files = chunk_paths
+            for i, chunk_duration in enumerate(self._get_audio_durations(chunk_paths)):
+                total_duration += chunk_duration
+                print(f"   ✅ Chunk {i+1} generated: {chunk_duration:.1f}s")
             
             print(f"🔗 Combining {len(temp_audio_files)} audio chunks...")
             
-            # Combine audio files using FFmpeg
-            combined_filename = f"{session_id}_combined.mp3"
-            combined_path = os.path.join(tempfile.gettempdir(), combined_filename)
-            
-            # Create FFmpeg concat file
-            concat_filename = f"{session_id}_concat.txt"
-            concat_path = os.path.join(tempfile.gettempdir(), concat_filename)
-            
-            with open(concat_path, 'w') as f:
-                for audio_file in temp_audio_files:
-                    # Escape the file path for FFmpeg
-                    escaped_path = audio_file.replace('\\', '\\\\').replace("'", "\\'")
-                    f.write(f"file '{escaped_path}'\n")
-            
             # Combine audio files
-            ffmpeg_cmd = [
-                'ffmpeg', '-y',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', concat_path,
-                '-c', 'copy',
-                combined_path
-            ]
-            
-            result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
+            combined, concat_error = self._concat_audio_files(
+                temp_audio_files, combined_path, audio_format
+            )
             
-            # Cleanup individual chunk files and concat file
+            # Cleanup individual chunk files
             for temp_file in temp_audio_files:
                 if os.path.exists(temp_file):
                     os.remove(temp_file)
-            if os.path.exists(concat_path):
-                os.remove(concat_path)
             
-            if result.returncode == 0:
+            if combined:
                 # Verify combined file was created
                 if os.path.exists(combined_path) and os.path.getsize(combined_path) > 0:
                     print(f"✅ Audio chunks combined successfully: {total_duration:.1f}s total")
@@ -756,21 +1666,310 @@ class VoiceoverSystem:
                 else:
                     return False, None, 0, "Combined audio file was not created properly"
             else:
-                return False, None, 0, f"FFmpeg error combining audio: {result.stderr}"
+                return False, None, 0, f"FFmpeg error combining audio: {concat_error}"
                 
         except Exception as e:
             # Cleanup on error
             for temp_file in temp_audio_files:
                 if os.path.exists(temp_file):
                     os.remove(temp_file)
-            if 'concat_path' in locals() and os.path.exists(concat_path):
-                os.remove(concat_path)
             if 'combined_path' in locals() and os.path.exists(combined_path):
                 os.remove(combined_path)
             
             return False, None, 0, f"Error in audio chunk generation: {str(e)}"
 
-    def _process_script_with_pauses(self, script, voice, speed, session_id):
+    def _run_ffmpeg(self, cmd, stderr_tail_bytes=8192, stdin_data=None):
+        """
+        Run an FFmpeg command quietly, keeping only the tail of stderr.
+        
+        Banner, progress stats and non-error log lines are switched off and
+        stdout is discarded, so long encodes don't buffer megabytes of output.
+        
+        Args:
+            cmd: FFmpeg command list, starting with 'ffmpeg'
+            stderr_tail_bytes: How much trailing stderr to keep for error reports
+            stdin_data: Optional bytes to feed FFmpeg on stdin (for pipe:0 inputs)
+        
+        Returns:
+            subprocess.CompletedProcess: returncode and decoded stderr tail
+        """
+        cmd = [cmd[0], '-hide_banner', '-nostats', '-loglevel', 'error', *cmd[1:]]
+        stderr_tail = b''
+        stdin = subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL
+        with subprocess.Popen(cmd, stdin=stdin, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as process:
+            if stdin_data is not None:
+                # Written from a thread so a large payload can't deadlock against stderr
+                def feed_stdin():
+                    try:
+                        process.stdin.write(stdin_data)
+                    except BrokenPipeError:
+                        pass
+                    finally:
+                        process.stdin.close()
+                
+                threading.Thread(target=feed_stdin, daemon=True).start()
+            for block in iter(lambda: process.stderr.read(4096), b''):
+                stderr_tail = (stderr_tail + block)[-stderr_tail_bytes:]
+            returncode = process.wait()
+        return subprocess.CompletedProcess(
+            cmd, returncode, None, stderr_tail.decode('utf-8', errors='replace')
+        )
+
+    def _append_mp3_data(self, output_file, data, stream_params=None, name='MP3 data'):
+        """
+        Append the frames of one in-memory MP3 stream to an open output file.
+        
+        MP3 frames are self-delimiting, so streams with the same sample rate and
+        channel layout can be concatenated byte for byte. ID3 tags and the
+        Xing/Info header frame are dropped so they don't end up mid-stream.
+        
+        Args:
+            output_file: Binary file object to append to
+            data: MP3 bytes
+            stream_params: (sample_rate, channel_mode) of previously appended data, if any
+            name: Label for error messages
+        
+        Returns:
+            tuple: (sample_rate, channel_mode) of the appended stream
+        
+        Raises:
+            ValueError: If data is not a bare MP3 stream
+            _StreamParamsMismatch: If its parameters differ from stream_params
+        """
+        end = len(data)
+        # Drop a trailing ID3v1 tag
+        if end >= 128 and data[end - 128:end - 125] == b'TAG':
+            end -= 128
+        
+        start = _id3v2_tag_size(data[:10])
+        frame = _parse_mp3_frame_header(data[start:start + 4])
+        if frame is None:
+            raise ValueError(f"No MP3 frame at start of {name}")
+        
+        params = (frame[2], frame[3])
+        if stream_params is not None and params != stream_params:
+            raise _StreamParamsMismatch(f"MP3 stream parameters differ in {name}")
+        
+        # A Xing/Info frame carries the length of its own stream only
+        first_frame = data[start:start + frame[0]]
+        if b'Xing' in first_frame or b'Info' in first_frame:
+            start += frame[0]
+        
+        output_file.write(memoryview(data)[start:end])
+        return params
+
+    def _append_mp3_files(self, input_paths, output_path):
+        """
+        Join MP3 files by appending their frames, without invoking FFmpeg.
+        
+        Raises:
+            ValueError: If an input is not a bare MP3 stream
+            _StreamParamsMismatch: If the inputs differ in sample rate or channel layout
+        """
+        stream_params = None
+        with open(output_path, 'wb') as output_file:
+            for input_path in input_paths:
+                with open(input_path, 'rb') as input_file:
+                    data = input_file.read()
+                stream_params = self._append_mp3_data(
+                    output_file, data, stream_params, os.path.basename(input_path)
+                )
+
+    def _append_wav_files(self, input_paths, output_path):
+        """
+        Join PCM WAV files by copying their sample data, without invoking FFmpeg.
+        
+        Raises:
+            _StreamParamsMismatch: If the inputs differ in channels, sample width or sample rate
+        """
+        stream_params = None
+        with wave.open(output_path, 'wb') as output_file:
+            for input_path in input_paths:
+                with wave.open(input_path, 'rb') as input_file:
+                    params = (
+                        input_file.getnchannels(),
+                        input_file.getsampwidth(),
+                        input_file.getframerate()
+                    )
+                    if stream_params is None:
+                        stream_params = params
+                        output_file.setnchannels(params[0])
+                        output_file.setsampwidth(params[1])
+                        output_file.setframerate(params[2])
+                    elif params != stream_params:
+                        raise _StreamParamsMismatch(f"WAV parameters differ in {os.path.basename(input_path)}")
+                    
+                    while True:
+                        frames = input_file.readframes(65536)
+                        if not frames:
+                            break
+                        output_file.writeframes(frames)
+
+    def _concat_audio_files(self, input_paths, output_path, audio_format):
+        """
+        Concatenate audio files of the same format into one file.
+        
+        MP3 and PCM WAV parts are appended frame by frame. Other formats, or parts that
+        can't be parsed, go through the FFmpeg concat demuxer with stream copy,
+        and a re-encode is only attempted if the copy fails. Parts whose stream
+        parameters differ are re-encoded straight away, since a stream copy would
+        splice mismatched audio into one stream.
+        
+        Args:
+            input_paths: Audio files in playback order
+            output_path: Destination audio file
+            audio_format: Format of the inputs and the output
+        
+        Returns:
+            tuple: (success: bool, error_msg: str)
+        """
+        stream_copy = True
+        if audio_format == 'mp3':
+            try:
+                self._append_mp3_files(input_paths, output_path)
+                return True, None
+            except _StreamParamsMismatch as e:
+                print(f"⚠️  {e}, re-encoding with FFmpeg")
+                stream_copy = False
+            except (OSError, ValueError) as e:
+                print(f"⚠️  MP3 append failed, falling back to FFmpeg concat: {e}")
+        elif audio_format == 'wav':
+            try:
+                self._append_wav_files(input_paths, output_path)
+                return True, None
+            except _StreamParamsMismatch as e:
+                print(f"⚠️  {e}, re-encoding with FFmpeg")
+                stream_copy = False
+            except (OSError, EOFError, ValueError, wave.Error) as e:
+                print(f"⚠️  WAV append failed, falling back to FFmpeg concat: {e}")
+        
+        # The concat list is fed on stdin, so there is no list file to write or clean up.
+        # Paths are absolute since there is no list file for relative ones to resolve against.
+        concat_list = ''.join(
+            f"file '{os.path.abspath(audio_file).translate(_CONCAT_PATH_ESCAPE_TABLE)}'\n"
+            for audio_file in input_paths
+        ).encode('utf-8')
+        
+        ffmpeg_cmd = [
+            'ffmpeg', '-y',
+            '-f', 'concat',
+            '-safe', '0',
+            '-protocol_whitelist', 'file,pipe',
+            '-i', 'pipe:0',
+            '-c', 'copy',
+            output_path
+        ]
+        if stream_copy:
+            result = self._run_ffmpeg(ffmpeg_cmd, stdin_data=concat_list)
+            if result.returncode == 0:
+                return True, None
+            print(f"⚠️  Stream copy concat failed, re-encoding: {result.stderr}")
+        
+        codec_args = {
+            'mp3': ['-c:a', 'libmp3lame', '-b:a', self.audio_bitrate],
+            'wav': ['-c:a', 'pcm_s16le'],
+            'flac': ['-c:a', 'flac'],
+            'aac': ['-c:a', 'aac', '-b:a', self.audio_bitrate],
+            'opus': ['-c:a', 'libopus', '-b:a', self.audio_bitrate]
+        }
+        ffmpeg_cmd[-3:-1] = codec_args[audio_format]
+        result = self._run_ffmpeg(ffmpeg_cmd, stdin_data=concat_list)
+        if result.returncode != 0:
+            return False, result.stderr
+        return True, None
+
+    def _generate_silence(self, audio_format='mp3'):
+        """
+        Return a cached pause_silence_seconds silence clip, rendering it with FFmpeg on first use.
+        
+        Silence is deterministic for a given duration and format, so the clip is
+        rendered once into the cache folder and shared by every pause.
+        
+        Args:
+            audio_format: Audio format of the surrounding TTS segments
+        
+        Returns:
+            str: Path to the silence clip, or None if it could not be rendered
+        """
+        cache_key = (round(self.pause_silence_seconds, 3), audio_format)
+        silence_path = self._silence_cache.get(cache_key)
+        if silence_path and os.path.exists(silence_path):
+            return silence_path
+        
+        silence_path = os.path.join(
+            self.cache_folder,
+            f"silence_{cache_key[0]}s_{self.tts_output_sample_rate}.{audio_format}"
+        )
+        if os.path.exists(silence_path) and os.path.getsize(silence_path) > 0:
+            self._silence_cache[cache_key] = silence_path
+            return silence_path
+        
+        if audio_format == 'wav':
+            # PCM silence is just zeroed samples, no FFmpeg process needed
+            temp_silence_path = f"{silence_path[:-4]}{uuid.uuid4().hex[:8]}.wav"
+            with wave.open(temp_silence_path, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(self.tts_output_sample_rate)
+                frame_count = int(round(self.pause_silence_seconds * self.tts_output_sample_rate))
+                wav_file.writeframes(bytes(frame_count * 2))
+            os.replace(temp_silence_path, silence_path)
+            self._silence_cache[cache_key] = silence_path
+            return silence_path
+        
+        # Match the TTS stream parameters so the segments can be joined without re-encoding
+        silence_source = f'anullsrc=channel_layout=mono:sample_rate={self.tts_output_sample_rate}'
+        silence_codec_args = {
+            # No Xing header, so the frames can be appended mid-stream
+            'mp3': ['-c:a', 'libmp3lame', '-b:a', '64k', '-write_xing', '0'],
+            'flac': ['-c:a', 'flac'],
+            'aac': ['-c:a', 'aac'],
+            'opus': ['-c:a', 'libopus']
+        }[audio_format]
+        # Render to a unique temp name and rename, so concurrent requests never read a partial file
+        temp_silence_path = f"{silence_path[:-len(audio_format)]}{uuid.uuid4().hex[:8]}.{audio_format}"
+        silence_cmd = [
+            'ffmpeg', '-y',
+            '-f', 'lavfi',
+            '-i', silence_source,
+            '-t', str(self.pause_silence_seconds),
+            *silence_codec_args,
+            temp_silence_path
+        ]
+        
+        result = self._run_ffmpeg(silence_cmd)
+        if result.returncode != 0:
+            print(f"⚠️  Failed to generate silence audio: {result.stderr}")
+            if os.path.exists(temp_silence_path):
+                os.remove(temp_silence_path)
+            return None
+        os.replace(temp_silence_path, silence_path)
+        self._silence_cache[cache_key] = silence_path
+        print(f"✅ Generated {self.pause_silence_seconds}s silence audio")
+        return silence_path
+
+    def _split_on_pause_markers(self, text):
+        """
+        Split text on pause markers in a single regex pass.
+        
+        Returns:
+            list: Non-empty, stripped segments (the whole text if it has no markers)
+        """
+        segments = []
+        last = 0
+        for match in _PAUSE_MARKER_PATTERN.finditer(text):
+            segment = text[last:match.start()].strip()
+            if segment:
+                segments.append(segment)
+            last = match.end()
+        
+        # Most scripts have no markers; skip copying them into a new segment
+        tail = text.strip() if last == 0 else text[last:].strip()
+        if tail:
+            segments.append(tail)
+        return segments
+
+    def _process_script_with_pauses(self, script, voice, speed, session_id, audio_format='mp3'):
         """
         Process a script with pause markers by generating separate audio segments
         and combining them with silence gaps.
@@ -780,6 +1979,7 @@ class VoiceoverSystem:
             voice: TTS voice
             speed: Speech speed
             session_id: Session ID for file naming
+            audio_format: Audio format requested from the TTS API
         
         Returns:
             tuple: (success, combined_audio_path, total_duration, error_msg)
@@ -790,9 +1990,7 @@ class VoiceoverSystem:
                 return None  # Signal to use regular processing
             
             # Split script by pause markers
-            pause_pattern = r'(?:—\s*pause\s*—|--\s*pause\s*--)'
-            segments = re.split(pause_pattern, script, flags=re.IGNORECASE)
-            segments = [seg.strip() for seg in segments if seg.strip()]
+            segments = self._split_on_pause_markers(script)
             
             if len(segments) <= 1:
                 # No pauses found, return None to use regular processing
@@ -802,132 +2000,79 @@ class VoiceoverSystem:
             print(f"🔄 Processing script with {len(segments)} segments and pauses...")
             
             temp_audio_files = []
-            temp_silence_file = None
+            silence_file = None
             total_duration = 0
             
-            # Generate silence audio file if needed
-            if self.pause_silence_seconds > 0:
-                silence_filename = f"{session_id}_silence.mp3"
-                temp_silence_file = os.path.join(tempfile.gettempdir(), silence_filename)
+            segment_paths = [
+                os.path.join(self.temp_folder, f"{session_id}_segment_{i+1}.{audio_format}")
+                for i in range(len(segments))
+            ]
+            # Segments are independent network-bound requests, so synthesize them
+            # concurrently while the silence clip is rendered on the side
+            print(f"   Generating {len(segments)} segments ({min(self.tts_concurrency, len(segments))} at a time)...")
+            with ThreadPoolExecutor(max_workers=1) as silence_executor:
+                silence_future = None
+                if self.pause_silence_seconds > 0:
+                    silence_future = silence_executor.submit(self._generate_silence, audio_format)
                 
-                # Generate silence using FFmpeg
-                silence_cmd = [
-                    'ffmpeg', '-y',
-                    '-f', 'lavfi',
-                    '-i', f'anullsrc=channel_layout=stereo:sample_rate={self.audio_sample_rate}',
-                    '-t', str(self.pause_silence_seconds),
-                    '-c:a', 'libmp3lame',
-                    '-b:a', self.audio_bitrate,
-                    temp_silence_file
-                ]
+                segment_errors = self.synthesize_many(segments, voice, speed, segment_paths, audio_format)
                 
-                result = subprocess.run(silence_cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    print(f"⚠️  Failed to generate silence audio: {result.stderr}")
-                    temp_silence_file = None
-                else:
-                    print(f"✅ Generated {self.pause_silence_seconds}s silence audio")
-            
-            # Generate audio for each segment
-            for i, segment in enumerate(segments):
-                print(f"   Generating segment {i+1}/{len(segments)} ({len(segment)} chars)...")
+                if silence_future:
+                    silence_file = silence_future.result()
+            
+            failed_segments = [i for i, error in enumerate(segment_errors) if error]
+            if failed_segments:
+                # Cleanup
+                for segment_path in segment_paths:
+                    if os.path.exists(segment_path):
+                        os.remove(segment_path)
+                first_failed = failed_segments[0]
+                return False, None, 0, f"Failed to generate segment {first_failed+1}: {segment_errors[first_failed]}"
+            
+            # Assemble segments in script order with pauses between them
+            segment_durations = self._get_audio_durations(segment_paths)
+            for i, (segment_path, segment_duration) in enumerate(zip(segment_paths, segment_durations)):
+                total_duration += segment_duration
                 
-                segment_filename = f"{session_id}_segment_{i+1}.mp3"
-                segment_path = os.path.join(tempfile.gettempdir(), segment_filename)
+                temp_audio_files.append(segment_path)
+                print(f"   ✅ Segment {i+1} generated: {segment_duration:.1f}s")
                 
-                try:
-                    # Generate TTS for this segment
-                    response = self.openai_client.audio.speech.create(
-                        model="tts-1",
-                        voice=voice,
-                        input=segment,
-                        speed=speed,
-                        response_format="mp3"
-                    )
-                    
-                    # Save segment audio
-                    with open(segment_path, 'wb') as f:
-                        f.write(response.content)
-                    
-                    if not os.path.exists(segment_path) or os.path.getsize(segment_path) == 0:
-                        raise Exception(f"Failed to create audio segment {i+1}")
-                    
-                    # Get duration
-                    segment_duration = self._get_audio_duration(segment_path)
-                    total_duration += segment_duration
-                    
-                    temp_audio_files.append(segment_path)
-                    print(f"   ✅ Segment {i+1} generated: {segment_duration:.1f}s")
-                    
-                    # Add pause/silence after this segment (except for last segment)
-                    if i < len(segments) - 1 and temp_silence_file and os.path.exists(temp_silence_file):
-                        temp_audio_files.append(temp_silence_file)
-                        total_duration += self.pause_silence_seconds
-                        print(f"   ⏸️  Added {self.pause_silence_seconds}s pause")
-                    
-                except Exception as segment_error:
-                    # Cleanup
-                    for temp_file in temp_audio_files:
-                        if temp_file != temp_silence_file and os.path.exists(temp_file):
-                            os.remove(temp_file)
-                    if temp_silence_file and os.path.exists(temp_silence_file):
-                        os.remove(temp_silence_file)
-                    return False, None, 0, f"Failed to generate segment {i+1}: {str(segment_error)}"
+                # Add pause/silence after this segment (except for last segment)
+                if i < len(segments) - 1 and silence_file:
+                    temp_audio_files.append(silence_file)
+                    total_duration += self.pause_silence_seconds
+                    print(f"   ⏸️  Added {self.pause_silence_seconds}s pause")
             
             print(f"🔗 Combining {len(segments)} segments with {len(segments)-1} pauses...")
             
-            # Create FFmpeg concat file
-            combined_filename = f"{session_id}_with_pauses.mp3"
-            combined_path = os.path.join(tempfile.gettempdir(), combined_filename)
-            
-            concat_filename = f"{session_id}_pause_concat.txt"
-            concat_path = os.path.join(tempfile.gettempdir(), concat_filename)
-            
-            with open(concat_path, 'w') as f:
-                for audio_file in temp_audio_files:
-                    escaped_path = audio_file.replace('\\', '\\\\').replace("'", "\\'")
-                    f.write(f"file '{escaped_path}'\n")
-            
             # Combine audio files with pauses
-            ffmpeg_cmd = [
-                'ffmpeg', '-y',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', concat_path,
-                '-c', 'copy',
-                combined_path
-            ]
+            combined_filename = f"{session_id}_with_pauses.{audio_format}"
+            combined_path = os.path.join(self.temp_folder, combined_filename)
             
-            result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
+            combined, concat_error = self._concat_audio_files(
+                temp_audio_files, combined_path, audio_format
+            )
             
-            # Cleanup individual segment files, silence file, and concat file
+            # Cleanup individual segment files (the silence clip is cached)
             for temp_file in temp_audio_files:
-                if temp_file != temp_silence_file and os.path.exists(temp_file):
+                if temp_file != silence_file and os.path.exists(temp_file):
                     os.remove(temp_file)
-            if temp_silence_file and os.path.exists(temp_silence_file):
-                os.remove(temp_silence_file)
-            if os.path.exists(concat_path):
-                os.remove(concat_path)
             
-            if result.returncode == 0:
+            if combined:
                 if os.path.exists(combined_path) and os.path.getsize(combined_path) > 0:
                     print(f"✅ Audio with pauses combined successfully: {total_duration:.1f}s total")
                     return True, combined_path, total_duration, None
                 else:
                     return False, None, 0, "Combined audio file was not created properly"
             else:
-                return False, None, 0, f"FFmpeg error combining audio with pauses: {result.stderr}"
+                return False, None, 0, f"FFmpeg error combining audio with pauses: {concat_error}"
                 
         except Exception as e:
             # Cleanup on error
             if 'temp_audio_files' in locals():
                 for temp_file in temp_audio_files:
-                    if temp_file != temp_silence_file and os.path.exists(temp_file):
+                    if temp_file != silence_file and os.path.exists(temp_file):
                         os.remove(temp_file)
-            if 'temp_silence_file' in locals() and temp_silence_file and os.path.exists(temp_silence_file):
-                os.remove(temp_silence_file)
-            if 'concat_path' in locals() and os.path.exists(concat_path):
-                os.remove(concat_path)
             if 'combined_path' in locals() and os.path.exists(combined_path):
                 os.remove(combined_path)
             
@@ -943,7 +2088,7 @@ class VoiceoverSystem:
             text: Text to convert to speech
             voice: Voice to use (alloy, echo, fable, onyx, nova, shimmer)
             speed: Speech speed (0.25 to 4.0)
-            format: Output format (mp3, wav, mp4)
+            format: Output format (mp3, opus, aac, flac, wav, mp4)
             session_id: Session ID for file naming
             background_image_path: Path to background image for video
             generation_type: 'regular', 'youtube_shorts', 'shorts', or 'standalone'
@@ -1011,6 +2156,9 @@ class VoiceoverSystem:
             processed_text = self._preprocess_text_for_tts(text)
             print(f"✅ Text preprocessed: {len(processed_text)} chars")
             
+            # Request audio formats natively from the API; video is muxed from video_tts_format
+            tts_format = format if format in self.tts_native_formats else self.video_tts_format
+            
             # Generate filename first (needed for pause processing)
             print(f"📁 Generating filename...")
             if custom_filename:
@@ -1028,13 +2176,33 @@ class VoiceoverSystem:
                     filename_base = f"voiceover_{str(uuid.uuid4())[:8]}"
                     print(f"Using UUID-based filename: {filename_base}")
             
+            # Set video dimensions based on generation type
+            print(f"🎬 Setting video dimensions...")
+            if generation_type in ['shorts', 'youtube_shorts']:
+                self.video_width = self.shorts_video_width
+                self.video_height = self.shorts_video_height
+            else:
+                self.video_width = self.regular_video_width
+                self.video_height = self.regular_video_height
+            print(f"✅ Video dimensions set to: {self.video_width}x{self.video_height} for type: {generation_type}")
+            
+            # Background frame, encoder probe and filter probe don't depend on the
+            # audio, so get them ready while TTS and the audio concat run
+            video_prep_future = None
+            if format == 'mp4':
+                video_prep_future = self._video_prep_executor.submit(
+                    self._prepare_video_assets, background_image_path, generation_type
+                )
+            
             # NEW: Check for pause markers and process accordingly (only for regular videos, not shorts)
             temp_audio_path = None
             duration = None
             
             if generation_type in ['regular', 'standalone'] and self.pause_enabled:
                 print(f"🔍 Checking for pause markers in script...")
-                pause_result = self._process_script_with_pauses(processed_text, voice, speed, filename_base)
+                pause_result = self._process_script_with_pauses(
+                    processed_text, voice, speed, filename_base, tts_format
+                )
                 
                 if pause_result is not None:
                     # Pause processing was attempted
@@ -1062,35 +2230,14 @@ class VoiceoverSystem:
                     print(f"📄 Text fits in single chunk")
                     text_chunks = [processed_text]
                 
-                # Set video dimensions based on generation type
-                print(f"🎬 Setting video dimensions...")
-                if generation_type in ['shorts', 'youtube_shorts']:
-                    self.video_width = self.shorts_video_width
-                    self.video_height = self.shorts_video_height
-                else:
-                    self.video_width = self.regular_video_width
-                    self.video_height = self.regular_video_height
-                
-                print(f"✅ Video dimensions set to: {self.video_width}x{self.video_height} for type: {generation_type}")
-                
                 # Generate TTS audio
                 if len(text_chunks) == 1:
                     print(f"🔊 Generating single TTS audio...")
-                    temp_audio_path = os.path.join(tempfile.gettempdir(), f"{filename_base}.mp3")
+                    temp_audio_path = os.path.join(self.temp_folder, f"{filename_base}.{tts_format}")
                     
                     try:
-                        response = self.openai_client.audio.speech.create(
-                            model="tts-1",
-                            voice=voice,
-                            input=text_chunks[0],
-                            speed=speed,
-                            response_format="mp3"
-                        )
-                        print(f"✅ OpenAI TTS response received")
-                        
-                        with open(temp_audio_path, 'wb') as f:
-                            f.write(response.content)
-                        print(f"✅ TTS audio saved: {temp_audio_path}")
+                        self._stream_tts_to_file(text_chunks[0], voice, speed, temp_audio_path, tts_format)
+                        print(f"✅ TTS audio streamed to: {temp_audio_path}")
                         
                         if os.path.exists(temp_audio_path):
                             file_size = os.path.getsize(temp_audio_path)
@@ -1115,7 +2262,7 @@ class VoiceoverSystem:
                 else:
                     print(f"🔊 Generating multiple TTS audio chunks...")
                     success, temp_audio_path, duration, error_msg = self._generate_multiple_audio_chunks(
-                        text_chunks, voice, speed, filename_base
+                        text_chunks, voice, speed, filename_base, tts_format
                     )
                     
                     if not success:
@@ -1129,14 +2276,6 @@ class VoiceoverSystem:
             
             # At this point, temp_audio_path and duration are set (either from pause processing or regular processing)
             
-            # Set video dimensions if not already set (for pause processing path)
-            if generation_type in ['shorts', 'youtube_shorts']:
-                self.video_width = self.shorts_video_width
-                self.video_height = self.shorts_video_height
-            else:
-                self.video_width = self.regular_video_width
-                self.video_height = self.regular_video_height
-            
             # Determine final output path and format
             print(f"🎯 Determining output format and path...")
             if format == 'mp4':
@@ -1146,6 +2285,7 @@ class VoiceoverSystem:
                 print(f"   Output path: {final_path}")
                 
                 try:
+                    video_prep_future.result()
                     success = self._create_video_with_audio(
                         temp_audio_path, 
                         final_path, 
@@ -1184,48 +2324,18 @@ class VoiceoverSystem:
                 final_path = os.path.join(self.output_folder, final_filename)
                 print(f"   Output path: {final_path}")
                 
-                if format == 'wav':
-                    print(f"🔄 Converting MP3 to WAV...")
-                    ffmpeg_cmd = [
-                        'ffmpeg', '-y',
-                        '-i', temp_audio_path,
-                        '-acodec', 'pcm_s16le',
-                        '-ar', str(self.audio_sample_rate),
-                        final_path
-                    ]
-                    
-                    try:
-                        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-                        if result.returncode != 0:
-                            print(f"❌ FFmpeg WAV conversion error: {result.stderr}")
-                            if os.path.exists(temp_audio_path):
-                                os.remove(temp_audio_path)
-                            return {
-                                'success': False,
-                                'error': 'Failed to convert to WAV format'
-                            }
-                        print(f"✅ WAV conversion successful")
-                    except Exception as wav_error:
-                        error_msg = f'WAV conversion failed: {str(wav_error)}'
-                        print(f"❌ WAV ERROR: {error_msg}")
-                        if os.path.exists(temp_audio_path):
-                            os.remove(temp_audio_path)
-                        return {
-                            'success': False,
-                            'error': error_msg
-                        }
-                else:
-                    print(f"📁 Moving MP3 file...")
-                    try:
-                        shutil.move(temp_audio_path, final_path)
-                        print(f"✅ MP3 file moved successfully")
-                    except Exception as move_error:
-                        error_msg = f'Failed to move MP3 file: {str(move_error)}'
-                        print(f"❌ MOVE ERROR: {error_msg}")
-                        return {
-                            'success': False,
-                            'error': error_msg
-                        }
+                # Audio formats are requested natively, so the staged file is the output
+                print(f"📁 Moving {format.upper()} file...")
+                try:
+                    self._move_into_place(temp_audio_path, final_path)
+                    print(f"✅ {format.upper()} file moved successfully")
+                except Exception as move_error:
+                    error_msg = f'Failed to move {format.upper()} file: {str(move_error)}'
+                    print(f"❌ MOVE ERROR: {error_msg}")
+                    return {
+                        'success': False,
+                        'error': error_msg
+                    }
             
             # Cleanup temporary audio file if it still exists
             if os.path.exists(temp_audio_path):
@@ -1246,6 +2356,7 @@ class VoiceoverSystem:
             
             final_file_size = os.path.getsize(final_path)
             print(f"📊 Final file size: {final_file_size} bytes")
+            self._on_file_written(final_filename, duration)
             
             file_url = f"/download-voiceover/{final_filename}"
             print(f"🔗 File URL: {file_url}")
@@ -1285,27 +2396,423 @@ class VoiceoverSystem:
                 'error': error_msg
             }
 
-    def _get_audio_duration(self, audio_path):
-        """Get duration of audio file using FFmpeg."""
+    def _get_audio_duration(self, audio_path, st=None):
+        """
+        Get duration of an audio file, falling back to 10 seconds if it cannot be read.
+        
+        See _lookup_audio_duration for how the duration is determined.
+        """
+        duration = self._lookup_audio_duration(audio_path, st)
+        if duration is None:
+            return 10.0  # Default fallback duration
+        return duration
+        
+    def _lookup_audio_duration(self, audio_path, st=None):
+        """
+        Get duration of an audio file, or None if it cannot be determined.
+        
+        WAV and MP3 durations are read from the file headers in-process; other
+        containers fall back to ffprobe. Results are cached per (path, mtime, size).
+        Callers that already stat()ed the file can pass the result as st.
+        """
+        try:
+            if st is None:
+                st = os.stat(audio_path)
+            cache_key = (os.path.abspath(audio_path), st.st_mtime_ns, st.st_size)
+            with self._duration_cache_lock:
+                if cache_key in self._duration_cache:
+                    self._duration_cache.move_to_end(cache_key)
+                    return self._duration_cache[cache_key]
+        
+            duration = self._read_audio_duration(audio_path)
+        except OSError as e:
+            # Missing file, or ffprobe not installed
+            print(f"Error getting audio duration: {e}")
+            return None
+        
+        if duration is not None:
+            self._remember_audio_duration(audio_path, duration, st)
+        return duration
+
+    def _get_audio_durations(self, audio_paths):
+        """
+        Get durations of several audio files, in order.
+        
+        ffprobe takes a single input per run, so files that need it (formats
+        without an in-process reader) are probed concurrently rather than one
+        after another.
+        """
+        if len(audio_paths) <= 1:
+            return [self._get_audio_duration(path) for path in audio_paths]
+        with ThreadPoolExecutor(max_workers=min(len(audio_paths), os.cpu_count() or 4)) as executor:
+            return list(executor.map(self._get_audio_duration, audio_paths))
+
+    def _remember_audio_duration(self, audio_path, duration, st=None):
+        """Seed the duration cache for a file whose duration is already known."""
+        try:
+            if st is None:
+                st = os.stat(audio_path)
+        except OSError:
+            return
+        cache_key = (os.path.abspath(audio_path), st.st_mtime_ns, st.st_size)
+        with self._duration_cache_lock:
+            self._duration_cache[cache_key] = duration
+            self._duration_cache.move_to_end(cache_key)
+            if len(self._duration_cache) > self._duration_cache_max_entries:
+                self._duration_cache.popitem(last=False)
+
+    def _read_audio_duration(self, audio_path):
+        """Read audio duration without caching; returns None if it cannot be determined."""
+        reader = self._duration_readers.get(os.path.splitext(audio_path)[1].lower())
+        if reader:
+            duration = reader(audio_path)
+            if duration is not None:
+                return duration
+        return self._probe_audio_duration(audio_path)
+
+    def _read_wav_duration(self, audio_path):
+        """Read WAV duration from its header; returns None if the header is unusable."""
+        try:
+            with wave.open(audio_path, 'rb') as wav_file:
+                # Streamed WAVs can carry a placeholder length, so cap it by the file size
+                frame_bytes = wav_file.getnchannels() * wav_file.getsampwidth()
+                frames = min(wav_file.getnframes(), (os.path.getsize(audio_path) - 44) // frame_bytes)
+                return frames / float(wav_file.getframerate())
+        except (wave.Error, EOFError) as e:
+            print(f"WAV header parse failed, falling back to ffprobe: {e}")
+            return None
+
+    def _read_mp3_duration_mutagen(self, audio_path):
+        """Read MP3 duration from its Xing/VBRI header with mutagen; returns None on failure."""
+        try:
+            return _MutagenMP3(audio_path).info.length
+        except Exception as e:
+            print(f"MP3 header parse failed, falling back to ffprobe: {e}")
+            return None
+
+    def _probe_audio_duration(self, audio_path):
+        """Read audio duration with ffprobe; returns None if it cannot be determined."""
+        # Ask only for the container duration, printed as a bare number
+        cmd = [
+            'ffprobe', '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1',
+            audio_path
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            try:
+                return float(result.stdout.strip())
+            except ValueError:
+                pass  # "N/A" for streams without a known duration
+        
+        print(f"FFprobe error: {result.stderr or result.stdout}")
+        return None
+
+    def _scan_mp3_duration(self, audio_path):
+        """
+        Compute MP3 file duration from its frame headers, without a subprocess.
+        
+        Returns:
+            float: Duration in seconds, or None if the file is not a bare MP3 stream
+        """
+        try:
+            with open(audio_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        return self._mp3_data_duration(data)
+
+    def _mp3_data_duration(self, data):
+        """
+        Compute the duration of in-memory MP3 data from its frame headers.
+        
+        Uses the Xing/Info frame count when present, otherwise walks every frame header.
+        
+        Returns:
+            float: Duration in seconds, or None if data is not a bare MP3 stream
+        """
+        offset = _id3v2_tag_size(data[:10])
+        frame = _parse_mp3_frame_header(data[offset:offset + 4])
+        if frame is None:
+            return None
+        samples_per_frame, sample_rate = frame[1], frame[2]
+        
+        # VBR header: 'Xing'/'Info' tag, 4-byte flags, then the frame count if flag bit 0 is set
+        first_frame = data[offset:offset + frame[0]]
+        for tag in (b'Xing', b'Info'):
+            tag_pos = first_frame.find(tag)
+            if tag_pos != -1:
+                if len(first_frame) >= tag_pos + 12:
+                    flags = int.from_bytes(first_frame[tag_pos + 4:tag_pos + 8], 'big')
+                    if flags & 0x1:
+                        frame_count = int.from_bytes(first_frame[tag_pos + 8:tag_pos + 12], 'big')
+                        return frame_count * samples_per_frame / float(sample_rate)
+                # The header frame itself holds no audio
+                offset += frame[0]
+                frame = _parse_mp3_frame_header(data[offset:offset + 4])
+                break
+        
+        frame_count = 0
+        while frame is not None and frame[0] > 4:
+            frame_count += 1
+            offset += frame[0]
+            frame = _parse_mp3_frame_header(data[offset:offset + 4])
+        return frame_count * samples_per_frame / float(sample_rate)
+
+    def _get_solid_background_png(self):
+        """
+        Return a cached single-frame PNG for the solid color background.
+        
+        The frame is rendered once per video size and reused, so video encodes
+        loop a still image instead of synthesizing the color every frame.
+        
+        Returns:
+            str: Path to the PNG, or None if it could not be rendered
+        """
+        png_path = os.path.join(self.cache_folder, f"bg_black_{self.video_width}x{self.video_height}.png")
+        if os.path.exists(png_path) and os.path.getsize(png_path) > 0:
+            return png_path
+        
+        # Render to a unique temp name and rename, so concurrent requests never read a partial file
+        temp_png_path = f"{png_path[:-4]}.{uuid.uuid4().hex[:8]}.png"
+        try:
+            from PIL import Image
+            Image.new('RGB', (self.video_width, self.video_height), (0, 0, 0)).save(temp_png_path)
+            os.replace(temp_png_path, png_path)
+            return png_path
+        except ImportError:
+            pass  # Pillow not installed, render the frame with FFmpeg
+        except OSError as e:
+            print(f"⚠️  Pillow could not write background frame, falling back to FFmpeg: {e}")
+            if os.path.exists(temp_png_path):
+                os.remove(temp_png_path)
+        
+        cmd = [
+            'ffmpeg', '-y',
+            '-f', 'lavfi',
+            '-i', f'color=c=black:s={self.video_width}x{self.video_height}',
+            '-frames:v', '1',
+            temp_png_path
+        ]
+        result = self._run_ffmpeg(cmd)
+        if result.returncode != 0:
+            print(f"⚠️  Failed to render background frame: {result.stderr}")
+            if os.path.exists(temp_png_path):
+                os.remove(temp_png_path)
+            return None
+        os.replace(temp_png_path, png_path)
+        return png_path
+
+    def _get_scaled_background_png(self, image_path):
+        """
+        Return a PNG of a background image scaled and center-cropped to the video size.
+        
+        Matches the scale=...:force_original_aspect_ratio=increase,crop filters,
+        but runs once per image and size instead of inside every encode.
+        Background images are per-request uploads, so the PNG is staged in the
+        temp folder (where the ahead-of-time prepare and the encode both find it)
+        and the encode removes it when done.
+        
+        Args:
+            image_path: Source background image
+        
+        Returns:
+            str: Path to the PNG, or None to scale inside the encode instead
+        """
+        try:
+            st = os.stat(image_path)
+        except OSError:
+            return None
+        key = hashlib.sha1(f"{os.path.abspath(image_path)}|{st.st_size}|{st.st_mtime_ns}".encode('utf-8')).hexdigest()[:16]
+        png_path = os.path.join(self.temp_folder, f"bg_{key}_{self.video_width}x{self.video_height}.png")
+        if os.path.exists(png_path) and os.path.getsize(png_path) > 0:
+            return png_path
+        
+        temp_png_path = f"{png_path[:-4]}.{uuid.uuid4().hex[:8]}.png"
+        try:
+            from PIL import Image, ImageOps
+            with Image.open(image_path) as image:
+                frame = ImageOps.fit(image.convert('RGB'), (self.video_width, self.video_height),
+                                     method=Image.LANCZOS, centering=(0.5, 0.5))
+                frame.save(temp_png_path)
+            os.replace(temp_png_path, png_path)
+            return png_path
+        except ImportError:
+            pass  # Pillow not installed, render the frame with FFmpeg
+        except OSError as e:
+            print(f"⚠️  Pillow could not prepare background image, falling back to FFmpeg: {e}")
+            if os.path.exists(temp_png_path):
+                os.remove(temp_png_path)
+        
+        cmd = [
+            'ffmpeg', '-y',
+            '-i', image_path,
+            '-vf', f"scale={self.video_width}:{self.video_height}:force_original_aspect_ratio=increase,"
+                   f"crop={self.video_width}:{self.video_height}",
+            '-frames:v', '1',
+            temp_png_path
+        ]
         try:
-            cmd = [
-                'ffprobe', '-v', 'quiet', '-print_format', 'json', 
-                '-show_format', audio_path
+            result = self._run_ffmpeg(cmd)
+        except OSError:
+            return None
+        if result.returncode != 0:
+            print(f"⚠️  Failed to prepare background image, scaling during encode: {result.stderr}")
+            if os.path.exists(temp_png_path):
+                os.remove(temp_png_path)
+            return None
+        os.replace(temp_png_path, png_path)
+        return png_path
+
+    def _get_video_encoder(self):
+        """
+        Return the H.264 encoder for video output, probing hardware encoders once.
+        
+        An FFmpeg build can list an encoder whose device is missing, so each
+        candidate is checked with a tiny test encode rather than `-encoders`.
+        
+        Returns:
+            str: FFmpeg encoder name (libx264 if no hardware encoder works)
+        """
+        if self._video_encoder is not None:
+            return self._video_encoder
+        
+        if self.video_encoder_preference == 'auto':
+            candidates = _HW_H264_ENCODERS
+        else:
+            candidates = (self.video_encoder_preference,)
+        
+        encoder = 'libx264'
+        for candidate in candidates:
+            if candidate == 'libx264':
+                break
+            probe_cmd = [
+                'ffmpeg', '-y',
+                '-f', 'lavfi',
+                '-i', 'color=c=black:s=256x256:d=0.1',
+                '-c:v', candidate,
+                '-f', 'null', '-'
+            ]
+            try:
+                if self._run_ffmpeg(probe_cmd).returncode == 0:
+                    encoder = candidate
+                    break
+            except OSError:
+                break  # FFmpeg itself is unavailable; the encode will report it
+        
+        print(f"🎞️  Video encoder: {encoder}")
+        self._video_encoder = encoder
+        return encoder
+
+    def _video_encoder_args(self, encoder, static_background=False):
+        """
+        Build the FFmpeg video codec arguments for an H.264 encoder.
+        
+        Args:
+            encoder: Encoder name from _get_video_encoder
+            static_background: True for image/solid backgrounds, which compress trivially
+        
+        Returns:
+            list: FFmpeg arguments starting with -c:v
+        """
+        # Static backgrounds (image or solid color) compress trivially, so every
+        # encoder gets its fastest preset for them at the same quality target
+        if encoder == 'h264_nvenc':
+            return [
+                '-c:v', encoder,
+                '-preset', 'p1' if static_background else 'p4',
+                '-rc', 'vbr',
+                '-cq', str(self.video_crf),
+                '-b:v', '0',
+                '-profile:v', self.video_profile,
+                '-pix_fmt', 'yuv420p'
+            ]
+        if encoder == 'h264_qsv':
+            return [
+                '-c:v', encoder,
+                '-preset', 'veryfast' if static_background else 'medium',
+                '-global_quality', str(self.video_crf),
+                '-profile:v', self.video_profile,
+                '-pix_fmt', 'nv12'
+            ]
+        if encoder == 'h264_videotoolbox':
+            return [
+                '-c:v', encoder,
+                '-b:v', self.video_hw_bitrate,
+                '-profile:v', self.video_profile,
+                '-pix_fmt', 'yuv420p'
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+        
+        # libx264 additionally gets still-image tuning
+        return [
+            '-c:v', 'libx264',
+            '-preset', 'ultrafast' if static_background else self.video_preset,
+            '-crf', str(self.video_crf),
+            '-profile:v', self.video_profile,
+            '-level', self.video_level,
+            '-tune', 'stillimage' if static_background else self.video_tune,
+            '-pix_fmt', 'yuv420p'
+        ]
+
+    def _prepare_video_assets(self, background_image_path, generation_type):
+        """
+        Warm the caches _create_video_with_audio reads before it builds its command.
+        
+        Runs alongside audio generation; anything that fails here is simply
+        retried (and reported) by the encode itself.
+        """
+        try:
+            self._get_video_encoder()
+            if self.text_overlay_enabled:
+                self._ffmpeg_has_filter('ass')
             
-            if result.returncode == 0:
-                import json
-                data = json.loads(result.stdout)
-                duration = float(data['format']['duration'])
-                return duration
+            background_video_path = self.get_background_video_path(generation_type)
+            if background_video_path and os.path.exists(background_video_path):
+                return
+            if background_image_path and os.path.exists(background_image_path):
+                self._get_scaled_background_png(background_image_path)
             else:
-                print(f"FFprobe error: {result.stderr}")
-                return 10.0  # Default fallback duration
-                
+                self._get_solid_background_png()
         except Exception as e:
-            print(f"Error getting audio duration: {e}")
-            return 10.0  # Default fallback duration
+            print(f"⚠️  Could not prepare video assets ahead of time: {e}")
+
+    def _safe_rmtree(self, path):
+        """
+        Remove a scratch directory, leaving anything it links to untouched.
+        
+        Symlinks are unlinked rather than followed, so shared cached assets
+        referenced from the directory survive. Errors are reported, not raised.
+        """
+        path = os.path.abspath(path)
+        if path == os.path.dirname(path):
+            print(f"⚠️  Refusing to remove filesystem root: {path}")
+            return
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        self._safe_rmtree(entry.path)
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                    except PermissionError:
+                        if entry.is_symlink():
+                            raise
+                        # Windows refuses to delete read-only files; clear the flag and
+                        # retry in the same pass instead of leaving the tree behind
+                        os.chmod(entry.path, stat.S_IWRITE)
+                        os.unlink(entry.path)
+            os.rmdir(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️  Could not remove {path}: {e}")
+
+    def _safe_rmtree_async(self, path):
+        """Remove a scratch directory on the cleanup thread so the caller can return right away."""
+        self._cleanup_executor.submit(self._safe_rmtree, path)
 
     def _create_video_with_audio(self, audio_path, output_path, text, 
                                 background_image_path=None, generation_type='regular', 
@@ -1327,6 +2834,7 @@ class VoiceoverSystem:
             
             # Input sources and track audio input index
             audio_input_index = 0
+            prescaled_image_path = None
             
             if (background_video_path and os.path.exists(background_video_path)):
                 print(f"Using background video: {background_video_path}")
@@ -1340,39 +2848,71 @@ class VoiceoverSystem:
                 audio_input_index = 1
             elif (background_image_path and os.path.exists(background_image_path)):
                 print(f"Using background image: {background_image_path}")
+                # Loop a frame already scaled/cropped to the output size when possible,
+                # otherwise read the still at 1 fps so scale/crop run once per second
+                prescaled_image_path = self._get_scaled_background_png(background_image_path)
                 ffmpeg_cmd.extend([
-                    '-loop', '1', '-i', background_image_path,
+                    '-loop', '1', '-framerate', '1', '-i', prescaled_image_path or background_image_path,
                     '-i', audio_path
                 ])
                 video_input = '[0:v]'
                 audio_input_index = 1
             else:
                 print("Using solid color background")
-                ffmpeg_cmd.extend(['-i', audio_path])
-                # Create solid color background with specified duration
-                color_input = f'color=c=black:s={self.video_width}x{self.video_height}:d={duration or 30}'
-                ffmpeg_cmd.extend(['-f', 'lavfi', '-i', color_input])
-                video_input = '[1:v]'
-                audio_input_index = 0
+                background_png = self._get_solid_background_png()
+                if background_png:
+                    # Loop a pre-rendered frame instead of generating the color every frame
+                    ffmpeg_cmd.extend([
+                        '-loop', '1', '-framerate', '1', '-i', background_png,
+                        '-i', audio_path
+                    ])
+                    video_input = '[0:v]'
+                    audio_input_index = 1
+                else:
+                    ffmpeg_cmd.extend(['-i', audio_path])
+                    # Create solid color background with specified duration
+                    color_input = f'color=c=black:s={self.video_width}x{self.video_height}:d={duration or 30}'
+                    ffmpeg_cmd.extend(['-f', 'lavfi', '-i', color_input])
+                    video_input = '[1:v]'
+                    audio_input_index = 0
             
             # Build filter chain
             filter_parts = []
+            captions_dir = None
             current_label = video_input
             
             # Scale and crop video/image to fit dimensions
-            if (background_video_path or background_image_path):
+            if (background_video_path or background_image_path) and not prescaled_image_path:
                 filter_parts.append(f"{current_label}scale={self.video_width}:{self.video_height}:force_original_aspect_ratio=increase[scaled]")
                 filter_parts.append(f"[scaled]crop={self.video_width}:{self.video_height}[cropped]")
                 current_label = '[cropped]'
             
+            # Looped stills come in at 1 fps; duplicate frames up to the output rate
+            # only after the expensive per-frame work, so captions still switch on time
+            still_input = not (background_video_path and os.path.exists(background_video_path)) and video_input == '[0:v]'
+            if still_input:
+                filter_parts.append(f"{current_label}fps={self.video_fps}[still]")
+                current_label = '[still]'
+            
             # Add text overlay if enabled - Use timed sections instead of full text
             if (self.text_overlay_enabled and text):
                 # Split text into timed sections that sync with voiceover
                 max_chars_per_section = 120 if generation_type in ['shorts', 'youtube_shorts'] else 200
                 timed_sections = self._split_text_into_timed_sections(text, duration or 30, max_chars_per_section)
                 
-                if (timed_sections):
-                    text_chain, final_label = self._build_timed_drawtext_chain(current_label, timed_sections)
+                # One libass overlay looks captions up by time instead of evaluating
+                # a drawtext node per caption on every frame. A custom font file is
+                # only honored exactly by drawtext, so keep that path for it.
+                # Caption files for this video share one directory, removed after the encode
+                if timed_sections:
+                    captions_dir = tempfile.mkdtemp(prefix=_CAPTIONS_DIR_PREFIX, dir=self.temp_folder)
+                if timed_sections and not self.text_overlay_font_path and self._ffmpeg_has_filter('ass'):
+                    subtitles_path = os.path.join(captions_dir, 'captions.ass')
+                    self._write_ass_subtitles(timed_sections, subtitles_path)
+                    filter_parts.append(f"{current_label}ass=filename={_escape_filter_value(subtitles_path)}[subs]")
+                    current_label = '[subs]'
+                elif (timed_sections):
+                    text_chain, final_label = self._build_timed_drawtext_chain(current_label, timed_sections, captions_dir)
                     if (text_chain):
                         filter_parts.append(text_chain)
                         current_label = final_label
@@ -1390,23 +2930,25 @@ class VoiceoverSystem:
             ffmpeg_cmd.extend(['-map', f'{audio_input_index}:a'])
             
             # Video encoding settings
-            ffmpeg_cmd.extend([
-                '-c:v', 'libx264',
-                '-preset', self.video_preset,
-                '-crf', str(self.video_crf),
-                '-profile:v', self.video_profile,
-                '-level', self.video_level,
-                '-tune', self.video_tune,
-                '-pix_fmt', 'yuv420p',
-                '-r', str(self.video_fps)
-            ])
-            
-            # Audio encoding settings
-            ffmpeg_cmd.extend([
-                '-c:a', 'aac',
-                '-b:a', self.audio_bitrate,
-                '-ar', str(self.audio_sample_rate)
-            ])
+            static_background = not (background_video_path and os.path.exists(background_video_path))
+            video_encoder = self._get_video_encoder()
+            encoder_args_index = len(ffmpeg_cmd)
+            encoder_args = self._video_encoder_args(video_encoder, static_background)
+            ffmpeg_cmd.extend(encoder_args)
+            ffmpeg_cmd.extend(['-r', str(self.video_fps)])
+            
+            # Audio encoding settings - TTS MP3/AAC is already encoded, so copy it into the MP4
+            if _file_format(audio_path) in ('mp3', 'aac'):
+                ffmpeg_cmd.extend(['-c:a', 'copy'])
+            else:
+                ffmpeg_cmd.extend([
+                    '-c:a', 'aac',
+                    '-b:a', self.audio_bitrate,
+                    '-ar', str(self.audio_sample_rate)
+                ])
+            
+            # Put the moov atom first so playback can start before the download finishes
+            ffmpeg_cmd.extend(['-movflags', '+faststart'])
             
             # NEW: Always set duration to match audio duration to ensure complete video
             if (duration):
@@ -1421,7 +2963,20 @@ class VoiceoverSystem:
             print(f"FFmpeg command: {' '.join(ffmpeg_cmd)}")
             
             # Execute FFmpeg
-            result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
+            try:
+                result = self._run_ffmpeg(ffmpeg_cmd)
+                
+                if result.returncode != 0 and video_encoder != 'libx264':
+                    # Hardware encoders can fail on sizes/levels the device doesn't support
+                    print(f"⚠️  {video_encoder} encode failed, retrying with libx264: {result.stderr}")
+                    ffmpeg_cmd[encoder_args_index:encoder_args_index + len(encoder_args)] = \
+                        self._video_encoder_args('libx264', static_background)
+                    result = self._run_ffmpeg(ffmpeg_cmd)
+            finally:
+                if captions_dir:
+                    self._safe_rmtree_async(captions_dir)
+                if prescaled_image_path and os.path.exists(prescaled_image_path):
+                    os.remove(prescaled_image_path)
             
             if (result.returncode == 0):
                 print(f"Video created successfully: {output_path}")